@@ -7,6 +7,14 @@ import sys
 import subprocess
 from pathlib import Path
 
+# Paths checked by the fixers, relative to the project root
+_SRC_DIR = Path("src")
+_REQUIREMENTS_FILE = Path("requirements.txt")
+_ENV_FILE = Path(".env")
+_PROXY_DIR = Path("1inch-express-proxy")
+_STARTUP_SH = Path("start_bot.sh")
+_STARTUP_BAT = Path("start_bot.bat")
+
 
 def print_header(title):
     """Print a formatted header"""
@@ -15,48 +23,49 @@ def print_header(title):
     print(f"{'='*60}")
 
 
-def check_file_exists(filepath, description):
-    """Check if a file exists and print status"""
-    if Path(filepath).exists():
-        print(f"✅ {description}: Found")
-        return True
-    else:
-        print(f"❌ {description}: Missing")
-        return False
+def _exists(path, present=None):
+    """Check a project-root path, answering from a pre-scanned listing when given one"""
+    if present is not None:
+        return path.name in present
+    return path.exists()
 
 
-def fix_deprecated_warnings():
+def fix_deprecated_warnings(present=None):
     """Fix deprecated dependency warnings"""
     print_header("Fixing Deprecated Dependencies")
     
     # Update requirements.txt to use setuptools < 81
-    requirements_file = Path("requirements.txt")
-    if requirements_file.exists():
+    requirements_file = _REQUIREMENTS_FILE
+    if present is not None and requirements_file.name not in present:
+        print("❌ requirements.txt not found")
+        return
+    try:
         content = requirements_file.read_text()
-        
-        # Add setuptools pin to avoid deprecation warnings
-        if "setuptools<81" not in content:
-            content += "\n# Fix deprecation warnings\nsetuptools<81\n"
-            requirements_file.write_text(content)
-            print("✅ Updated requirements.txt to fix deprecation warnings")
-        else:
-            print("✅ Deprecation warnings already fixed")
-    else:
+    except FileNotFoundError:
         print("❌ requirements.txt not found")
+        return
+    
+    # Add setuptools pin to avoid deprecation warnings
+    if "setuptools<81" not in content:
+        content += "\n# Fix deprecation warnings\nsetuptools<81\n"
+        requirements_file.write_text(content)
+        print("✅ Updated requirements.txt to fix deprecation warnings")
+    else:
+        print("✅ Deprecation warnings already fixed")
 
 
-def check_env_file():
+def check_env_file(present=None):
     """Check if .env file exists and is properly configured"""
     print_header("Checking Environment Configuration")
     
-    env_file = Path(".env")
-    if env_file.exists():
+    env_file = _ENV_FILE
+    if _exists(env_file, present):
         print("✅ .env file found")
         
         # Check if key variables are set
         try:
             from dotenv import load_dotenv
-            load_dotenv()
+            load_dotenv(env_file, override=False)
             
             required_vars = [
                 "ONEINCH_API_KEY",
@@ -96,7 +105,7 @@ def fix_import_issues():
     # Check if all required modules can be imported
     try:
         import sys
-        sys.path.insert(0, str(Path("src")))
+        sys.path.insert(0, str(_SRC_DIR))
         
         from src import config
         print("✅ Config module imports successfully")
@@ -114,12 +123,19 @@ def fix_import_issues():
     return True
 
 
-def check_proxy_setup():
+def check_proxy_setup(present=None):
     """Check proxy setup"""
     print_header("Checking Proxy Setup")
     
-    proxy_dir = Path("1inch-express-proxy")
-    if not proxy_dir.exists():
+    proxy_dir = _PROXY_DIR
+    if present is not None and proxy_dir.name not in present:
+        print("❌ Proxy directory not found")
+        return False
+    try:
+        # One directory listing instead of a stat per file
+        with os.scandir(proxy_dir) as it:
+            entries = {entry.name: entry for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
         print("❌ Proxy directory not found")
         return False
     
@@ -130,16 +146,18 @@ def check_proxy_setup():
     
     all_exist = True
     for file in proxy_files:
-        if check_file_exists(proxy_dir / file, f"Proxy {file}"):
-            continue
+        if file in entries:
+            print(f"✅ Proxy {file}: Found")
         else:
+            print(f"❌ Proxy {file}: Missing")
             all_exist = False
     
     if all_exist:
         print("✅ Proxy setup looks good")
         
         # Check if node_modules exists
-        if (proxy_dir / "node_modules").exists():
+        node_modules = entries.get("node_modules")
+        if node_modules is not None and node_modules.is_dir():
             print("✅ Proxy dependencies installed")
         else:
             print("⚠️  Proxy dependencies not installed. Run: cd 1inch-express-proxy && npm install")
@@ -147,7 +165,7 @@ def check_proxy_setup():
     return all_exist
 
 
-def create_startup_script():
+def create_startup_script(present=None):
     """Create a startup script for easy launching"""
     print_header("Creating Startup Script")
     
@@ -176,8 +194,8 @@ echo "✅ Starting bot with improved configuration..."
 python -u -m src.main_improved
 """
     
-    startup_file = Path("start_bot.sh")
-    if not startup_file.exists():
+    startup_file = _STARTUP_SH
+    if not _exists(startup_file, present):
         startup_file.write_text(startup_script)
         startup_file.chmod(0o755)  # Make executable
         print("✅ Created start_bot.sh script")
@@ -211,8 +229,8 @@ python -u -m src.main_improved
 pause
 """
     
-    startup_bat_file = Path("start_bot.bat")
-    if not startup_bat_file.exists():
+    startup_bat_file = _STARTUP_BAT
+    if not _exists(startup_bat_file, present):
         startup_bat_file.write_text(startup_bat)
         print("✅ Created start_bot.bat script")
     else:
@@ -224,22 +242,26 @@ def main():
     print("🔧 ETHGlobal Trading Bot - Quick Fix Script")
     print("This script will fix common issues and improve your setup.")
     
+    # List the project root once; each check answers from this set
+    with os.scandir(".") as it:
+        present = {entry.name for entry in it}
+    
     # Check current directory
-    if not Path("src").exists():
+    if not _exists(_SRC_DIR, present):
         print("❌ Please run this script from the project root directory")
         sys.exit(1)
     
     # Run all fixes
-    fix_deprecated_warnings()
-    check_env_file()
+    fix_deprecated_warnings(present)
+    check_env_file(present)
     
     if fix_import_issues():
         print("✅ All imports working correctly")
     else:
         print("❌ Some import issues detected")
     
-    check_proxy_setup()
-    create_startup_script()
+    check_proxy_setup(present)
+    create_startup_script(present)
     
     print_header("Quick Fix Complete")
     print("✅ All fixes applied!")
@@ -4,9 +4,17 @@ Setup script for 1inch proxy configuration
 import os
 import subprocess
 import sys
+import shutil
 import time
+from functools import lru_cache
 from pathlib import Path
 
+# requests is only needed by `test`; import it on first use to keep startup fast
+_requests = None
+
+# Shared HTTP session for proxy checks, created on first use
+_SESSION = None
+
 
 def print_banner():
     """Print setup banner"""
@@ -14,34 +22,40 @@ def print_banner():
     print("=" * 50)
 
 
-def check_node_installed():
-    """Check if Node.js is installed"""
+@lru_cache(maxsize=None)
+def _tool_path(name):
+    """Resolve an executable on PATH once per process"""
+    return shutil.which(name)
+
+
+def _check_tool(name, label):
+    """Check a tool is on PATH and report its version, skipping the spawn when it is missing"""
+    path = _tool_path(name)
+    if path is None:
+        print(f"❌ {label} not found")
+        return False
+    
     try:
-        result = subprocess.run(["node", "--version"], capture_output=True, text=True)
-        if result.returncode == 0:
-            print(f"✅ Node.js installed: {result.stdout.strip()}")
-            return True
-        else:
-            print("❌ Node.js not found")
-            return False
-    except FileNotFoundError:
-        print("❌ Node.js not found")
+        # An absolute path, no cwd and close_fds=False (safe: fds are non-inheritable
+        # by default, PEP 446) let subprocess use posix_spawn instead of fork+exec
+        result = subprocess.run([path, "--version"], capture_output=True, text=True, close_fds=False)
+    except OSError:
+        result = None
+    if result is None or result.returncode != 0:
+        print(f"❌ {label} not found")
         return False
+    print(f"✅ {label} installed: {result.stdout.strip()}")
+    return True
+
+
+def check_node_installed():
+    """Check if Node.js is installed"""
+    return _check_tool("node", "Node.js")
 
 
 def check_npm_installed():
     """Check if npm is installed"""
-    try:
-        result = subprocess.run(["npm", "--version"], capture_output=True, text=True)
-        if result.returncode == 0:
-            print(f"✅ npm installed: {result.stdout.strip()}")
-            return True
-        else:
-            print("❌ npm not found")
-            return False
-    except FileNotFoundError:
-        print("❌ npm not found")
-        return False
+    return _check_tool("npm", "npm")
 
 
 def install_proxy_dependencies():
@@ -74,6 +88,12 @@ def install_proxy_dependencies():
         return False
 
 
+def _load_env(path):
+    """Parse a .env file into its set values"""
+    from dotenv import dotenv_values
+    return {k: v for k, v in dotenv_values(path).items() if v is not None}
+
+
 def create_env_file():
     """Create or update .env file"""
     env_file = Path(".env")
@@ -86,31 +106,15 @@ def create_env_file():
         print("❌ API key is required")
         return False
     
-    # Check if .env exists
-    env_content = []
-    if env_file.exists():
-        with open(env_file, 'r') as f:
-            env_content = f.readlines()
+    from dotenv import set_key
     
-    # Update or add ONEINCH_API_KEY
-    updated = False
-    for i, line in enumerate(env_content):
-        if line.startswith("ONEINCH_API_KEY="):
-            env_content[i] = f"ONEINCH_API_KEY={api_key}\n"
-            updated = True
-            break
-    
-    if not updated:
-        env_content.append(f"ONEINCH_API_KEY={api_key}\n")
+    # Update or add ONEINCH_API_KEY in place
+    env_file.touch(exist_ok=True)
+    set_key(env_file, "ONEINCH_API_KEY", api_key, quote_mode="never")
     
     # Add proxy URL if not exists
-    proxy_exists = any(line.startswith("ONEINCH_PROXY_URL=") for line in env_content)
-    if not proxy_exists:
-        env_content.append("ONEINCH_PROXY_URL=http://localhost:3000\n")
-    
-    # Write back to file
-    with open(env_file, 'w') as f:
-        f.writelines(env_content)
+    if "ONEINCH_PROXY_URL" not in _load_env(env_file):
+        set_key(env_file, "ONEINCH_PROXY_URL", "http://localhost:3000", quote_mode="never")
     
     print("✅ Environment variables configured")
     return True
@@ -124,15 +128,18 @@ def start_proxy():
     print("   The proxy will run on http://localhost:3000")
     print("   Press Ctrl+C to stop the proxy")
     
+    env_file = Path(".env")
+    if not env_file.is_file():
+        # Without it the proxy would start with no AUTHORIZATION and every call would 401
+        print(f"❌ Error starting proxy: {env_file} not found")
+        return
+    
     try:
         # Set environment variable for authorization
         env = os.environ.copy()
-        with open(".env", 'r') as f:
-            for line in f:
-                if line.startswith("ONEINCH_API_KEY="):
-                    api_key = line.split("=", 1)[1].strip()
-                    env["AUTHORIZATION"] = f"Bearer {api_key}"
-                    break
+        api_key = _load_env(env_file).get("ONEINCH_API_KEY")
+        if api_key:
+            env["AUTHORIZATION"] = f"Bearer {api_key}"
         
         # Start the proxy server
         subprocess.run(["node", "index.js"], cwd=proxy_dir, env=env)
@@ -143,15 +150,34 @@ def start_proxy():
         print(f"❌ Error starting proxy: {e}")
 
 
+def _lazy_requests():
+    """Import requests once and keep a module-level reference"""
+    global _requests
+    if _requests is None:
+        import requests
+        _requests = requests
+    return _requests
+
+
+def _get_session():
+    """Return the shared requests session, creating it on first use"""
+    global _SESSION
+    if _SESSION is None:
+        requests = _lazy_requests()
+        _SESSION = requests.Session()
+        _SESSION.mount("http://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=4))
+    return _SESSION
+
+
 def test_proxy():
     """Test proxy functionality"""
     print("🧪 Testing proxy...")
     
-    import requests
+    requests = _lazy_requests()
     
     try:
         # Test proxy endpoint
-        response = requests.get(
+        response = _get_session().get(
             "http://localhost:3000/",
             params={
                 "url": "https://api.1inch.dev/swap/v6.0/42161/tokens"
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List
+from typing import List, NamedTuple
+import math
 import time
 
+import numpy as np
 
-@dataclass
-class ChildOrder:
+
+class ChildOrder(NamedTuple):
     side: str
     base: str
     quote: str
@@ -33,9 +34,9 @@ def build_twap(
 ) -> List[ChildOrder]:
     per = total_amount / max(1, slices)
     if end_price is None:
-        prices = [start_price for _ in range(slices)]
+        prices = np.full(slices, start_price, dtype=float).tolist()
     else:
-        prices = [start_price + (end_price - start_price) * i / max(1, slices - 1) for i in range(slices)]
+        prices = np.linspace(start_price, end_price, slices).tolist()
     return [
         ChildOrder(side, base, quote, per, prices[i], expiry_each_secs, True, post_only, f"{tag}:twap:{i}")
         for i in range(slices)
@@ -55,7 +56,7 @@ def build_ladder(
     tag: str,
 ) -> List[ChildOrder]:
     per = total_amount / max(1, steps)
-    prices = [p_min + (p_max - p_min) * i / max(1, steps - 1) for i in range(steps)]
+    prices = np.linspace(p_min, p_max, steps).tolist()
     return [
         ChildOrder(side, base, quote, per, prices[i], expiry_secs, True, post_only, f"{tag}:ladder:{i}")
         for i in range(steps)
@@ -75,17 +76,14 @@ def build_dutch(
     post_only: bool,
     tag: str,
 ) -> List[ChildOrder]:
-    prices: List[float] = []
-    if side.upper() == "SELL":
-        p = start_price
-        while p >= end_price:
-            prices.append(p)
-            p -= step
-    else:
-        p = start_price
-        while p <= end_price:
-            prices.append(p)
-            p += step
+    if step <= 0:
+        raise ValueError("step must be positive")
+    direction = -1.0 if side.upper() == "SELL" else 1.0
+    # Count the levels up front (with a small tolerance so an exact end_price
+    # is kept) instead of accumulating float error through repeated +/- step.
+    span = (end_price - start_price) * direction
+    n = max(0, math.floor(span / step + 1e-9) + 1)
+    prices = (start_price + direction * step * np.arange(n)).tolist()
     return [
         ChildOrder(side, base, quote, amount, p, expiry_each_secs, True, post_only, f"{tag}:dutch:{i}")
         for i, p in enumerate(prices)
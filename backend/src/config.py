@@ -4,8 +4,6 @@ import os
 from pathlib import Path
 from typing import Optional
 
-from dotenv import load_dotenv
-
 
 def _safe_int(value: Optional[str], default: Optional[int] = None) -> Optional[int]:
     if value is None or value == "":
@@ -16,9 +14,21 @@ def _safe_int(value: Optional[str], default: Optional[int] = None) -> Optional[i
         return default
 
 
-# Load environment from project root .env if present
+# Load environment from project root .env if present. Production relies on the
+# real environment, and PYTHONNODOTENV=1 skips importing dotenv altogether.
+# ENVIRONMENT values treated as production, here and by ConfigValidator
+PRODUCTION_ENV_NAMES = ("prod", "production")
+
 project_root = Path(__file__).resolve().parents[1]
-load_dotenv(dotenv_path=project_root / ".env", override=False)
+_env_file = project_root / ".env"
+if (
+    os.getenv("ENVIRONMENT", "development").lower() not in PRODUCTION_ENV_NAMES
+    and not os.getenv("PYTHONNODOTENV")
+    and _env_file.is_file()
+):
+    from dotenv import load_dotenv
+
+    load_dotenv(dotenv_path=_env_file, override=False)
 
 # Blockchain
 RPC_URL: Optional[str] = os.getenv("RPC_URL")
@@ -39,6 +49,8 @@ ZERO_G_RPC_URL: Optional[str] = os.getenv("ZERO_G_RPC_URL")
 WETH_ADDRESS: Optional[str] = os.getenv("WETH_ADDRESS")
 USDC_ADDRESS: Optional[str] = os.getenv("USDC_ADDRESS")
 UNISWAP_V3_ROUTER_ADDRESS: Optional[str] = os.getenv("UNISWAP_V3_ROUTER_ADDRESS")
+# Multicall3 is deployed at the same address on most EVM chains; set empty to disable batching
+MULTICALL3_ADDRESS: Optional[str] = os.getenv("MULTICALL3_ADDRESS", "0xcA11bde05977b3631167028862bE2a173976CA11")
 
 # Trading params
 TRADE_AMOUNT_WEI: Optional[int] = _safe_int(os.getenv("TRADE_AMOUNT_WEI"))
@@ -65,19 +77,11 @@ PYTH_ETH_USD_FEED_ID_SOL: Optional[str] = os.getenv("PYTH_ETH_USD_FEED_ID_SOL")
 TRADE_AMOUNT_LAMPORTS: Optional[int] = _safe_int(os.getenv("TRADE_AMOUNT_LAMPORTS"))
 
 
+_CRITICAL_KEYS = ("RPC_URL", "CHAIN_ID", "PRIVATE_KEY", "PUBLIC_KEY", "PYTH_ETH_USD_FEED_ID")
+
+
 def validate_critical_config() -> None:
-    missing = []
-    if not RPC_URL:
-        missing.append("RPC_URL")
-    if CHAIN_ID is None:
-        missing.append("CHAIN_ID")
-    if not PRIVATE_KEY:
-        missing.append("PRIVATE_KEY")
-    if not PUBLIC_KEY:
-        missing.append("PUBLIC_KEY")
-    if not PYTH_ETH_USD_FEED_ID:
-        missing.append("PYTH_ETH_USD_FEED_ID")
+    settings = globals()
+    missing = [name for name in _CRITICAL_KEYS if not settings.get(name)]
     if missing:
         raise RuntimeError(f"Missing required environment variables: {', '.join(missing)}")
-
-
@@ -4,7 +4,8 @@ Configuration validation and environment setup
 from __future__ import annotations
 
 import os
-from typing import Dict, List, Optional, Any
+from itertools import chain
+from typing import Callable, Dict, Iterator, List, Optional, Any
 from dataclasses import dataclass
 from enum import Enum
 
@@ -24,6 +25,67 @@ class ValidationResult:
     warnings: List[str]
 
 
+def _is_http_url(value: str) -> bool:
+    return value.startswith("http")
+
+
+def _is_hex_prefixed(value: str) -> bool:
+    return value.startswith("0x")
+
+
+def _is_solana_address(value: str) -> bool:
+    # Solana addresses are base58; anything shorter than 32 chars can't be one
+    return len(value) >= 32
+
+
+# Format rules as (setting, check, message). A rule only applies when the
+# setting is non-empty, and settings are read at validation time because
+# chain presets can override config values at runtime.
+FormatRule = tuple[str, Callable[[str], bool], str]
+# Validators yield (level, message) issues, level being _ERROR or _WARNING
+Issue = tuple[str, str]
+
+_ERROR = "error"
+_WARNING = "warning"
+
+_EVM_REQUIRED = ("RPC_URL", "CHAIN_ID", "PRIVATE_KEY", "PUBLIC_KEY", "WETH_ADDRESS", "USDC_ADDRESS")
+_SOLANA_REQUIRED = ("SOLANA_RPC_URL", "SOLANA_PRIVATE_KEY", "SOLANA_PUBLIC_KEY", "WSOL_MINT", "USDC_MINT")
+
+_EVM_RULES: tuple[FormatRule, ...] = (
+    ("RPC_URL", _is_http_url, "RPC_URL must be a valid HTTP/HTTPS URL"),
+    ("PRIVATE_KEY", _is_hex_prefixed, "PRIVATE_KEY must start with '0x'"),
+    ("WETH_ADDRESS", _is_hex_prefixed, "WETH_ADDRESS must be a valid Ethereum address"),
+    ("USDC_ADDRESS", _is_hex_prefixed, "USDC_ADDRESS must be a valid Ethereum address"),
+)
+
+_SOLANA_RULES: tuple[FormatRule, ...] = (
+    ("SOLANA_RPC_URL", _is_http_url, "SOLANA_RPC_URL must be a valid HTTP/HTTPS URL"),
+    ("WSOL_MINT", _is_solana_address, "WSOL_MINT must be a valid Solana address"),
+    ("USDC_MINT", _is_solana_address, "USDC_MINT must be a valid Solana address"),
+)
+
+_API_KEY_RULES: tuple[FormatRule, ...] = (
+    ("ONEINCH_API_KEY", lambda v: len(v) >= 20, "ONEINCH_API_KEY seems too short - please verify it's correct"),
+)
+
+_PROXY_RULES: tuple[FormatRule, ...] = (
+    ("ONEINCH_PROXY_URL", _is_http_url, "ONEINCH_PROXY_URL should be a valid HTTP/HTTPS URL"),
+    ("ONEINCH_CLOUD_PROXY_URL", _is_http_url, "ONEINCH_CLOUD_PROXY_URL should be a valid HTTP/HTTPS URL"),
+)
+
+
+def _check_formats(rules: tuple[FormatRule, ...], level: str) -> Iterator[Issue]:
+    """Yield an issue for every rule whose setting is set but malformed"""
+    for name, check, message in rules:
+        value = getattr(config, name, None)
+        if value and not check(value):
+            yield level, message
+
+
+def _all_set(names: tuple[str, ...]) -> bool:
+    return all(getattr(config, name, None) for name in names)
+
+
 class ConfigValidator:
     """Validates configuration and provides helpful error messages"""
     
@@ -33,7 +95,7 @@ class ConfigValidator:
     def _detect_environment(self) -> Environment:
         """Detect current environment"""
         env = os.getenv("ENVIRONMENT", "development").lower()
-        if env in ["prod", "production"]:
+        if env in config.PRODUCTION_ENV_NAMES:
             return Environment.PRODUCTION
         elif env in ["stage", "staging"]:
             return Environment.STAGING
@@ -45,23 +107,14 @@ class ConfigValidator:
         errors = []
         warnings = []
         
-        # Validate critical config
-        critical_errors = self._validate_critical_config()
-        errors.extend(critical_errors)
-        
-        # Validate chain-specific config
-        chain_errors, chain_warnings = self._validate_chain_config()
-        errors.extend(chain_errors)
-        warnings.extend(chain_warnings)
-        
-        # Validate API keys
-        api_errors, api_warnings = self._validate_api_keys()
-        errors.extend(api_errors)
-        warnings.extend(api_warnings)
-        
-        # Validate proxy configuration
-        proxy_warnings = self._validate_proxy_config()
-        warnings.extend(proxy_warnings)
+        # One pass over every validator's issues
+        for level, message in chain(
+            self._validate_critical_config(),
+            self._validate_chain_config(),
+            self._validate_api_keys(),
+            self._validate_proxy_config(),
+        ):
+            (errors if level == _ERROR else warnings).append(message)
         
         return ValidationResult(
             is_valid=len(errors) == 0,
@@ -69,133 +122,55 @@ class ConfigValidator:
             warnings=warnings
         )
     
-    def _validate_critical_config(self) -> List[str]:
+    def _validate_critical_config(self) -> Iterator[Issue]:
         """Validate critical configuration"""
-        errors = []
-        
         if not config.ONEINCH_API_KEY:
-            errors.append("ONEINCH_API_KEY is required")
+            yield _ERROR, "ONEINCH_API_KEY is required"
         
         if not config.PYTH_ETH_USD_FEED_ID:
-            errors.append("PYTH_ETH_USD_FEED_ID is required")
-        
-        return errors
+            yield _ERROR, "PYTH_ETH_USD_FEED_ID is required"
     
-    def _validate_chain_config(self) -> tuple[List[str], List[str]]:
+    def _validate_chain_config(self) -> Iterator[Issue]:
         """Validate chain-specific configuration"""
-        errors = []
-        warnings = []
-        
-        # Check if we have EVM configuration
-        has_evm_config = all([
-            config.RPC_URL,
-            config.CHAIN_ID,
-            config.PRIVATE_KEY,
-            config.PUBLIC_KEY,
-            config.WETH_ADDRESS,
-            config.USDC_ADDRESS
-        ])
-        
-        # Check if we have Solana configuration
-        has_solana_config = all([
-            config.SOLANA_RPC_URL,
-            config.SOLANA_PRIVATE_KEY,
-            config.SOLANA_PUBLIC_KEY,
-            config.WSOL_MINT,
-            config.USDC_MINT
-        ])
+        has_evm_config = _all_set(_EVM_REQUIRED)
+        has_solana_config = _all_set(_SOLANA_REQUIRED)
         
         if not has_evm_config and not has_solana_config:
-            errors.append("At least one chain configuration (EVM or Solana) must be complete")
+            yield _ERROR, "At least one chain configuration (EVM or Solana) must be complete"
         
         if has_evm_config:
-            evm_errors, evm_warnings = self._validate_evm_config()
-            errors.extend(evm_errors)
-            warnings.extend(evm_warnings)
+            yield from self._validate_evm_config()
         
         if has_solana_config:
-            solana_errors, solana_warnings = self._validate_solana_config()
-            errors.extend(solana_errors)
-            warnings.extend(solana_warnings)
-        
-        return errors, warnings
+            yield from self._validate_solana_config()
     
-    def _validate_evm_config(self) -> tuple[List[str], List[str]]:
+    def _validate_evm_config(self) -> Iterator[Issue]:
         """Validate EVM chain configuration"""
-        errors = []
-        warnings = []
-        
         if config.CHAIN_ID != config.ONEINCH_CHAIN_ID:
-            warnings.append(
+            yield _WARNING, (
                 f"CHAIN_ID ({config.CHAIN_ID}) and ONEINCH_CHAIN_ID ({config.ONEINCH_CHAIN_ID}) "
                 "should match for consistent behavior"
             )
         
-        # Validate RPC URL
-        if config.RPC_URL and not config.RPC_URL.startswith("http"):
-            errors.append("RPC_URL must be a valid HTTP/HTTPS URL")
-        
-        # Validate private key format
-        if config.PRIVATE_KEY and not config.PRIVATE_KEY.startswith("0x"):
-            errors.append("PRIVATE_KEY must start with '0x'")
-        
-        # Validate token addresses
-        if config.WETH_ADDRESS and not config.WETH_ADDRESS.startswith("0x"):
-            errors.append("WETH_ADDRESS must be a valid Ethereum address")
-        
-        if config.USDC_ADDRESS and not config.USDC_ADDRESS.startswith("0x"):
-            errors.append("USDC_ADDRESS must be a valid Ethereum address")
-        
-        return errors, warnings
+        yield from _check_formats(_EVM_RULES, _ERROR)
     
-    def _validate_solana_config(self) -> tuple[List[str], List[str]]:
+    def _validate_solana_config(self) -> Iterator[Issue]:
         """Validate Solana configuration"""
-        errors = []
-        warnings = []
-        
-        # Validate RPC URL
-        if config.SOLANA_RPC_URL and not config.SOLANA_RPC_URL.startswith("http"):
-            errors.append("SOLANA_RPC_URL must be a valid HTTP/HTTPS URL")
-        
-        # Validate mint addresses (Solana addresses are base58)
-        if config.WSOL_MINT and len(config.WSOL_MINT) < 32:
-            errors.append("WSOL_MINT must be a valid Solana address")
-        
-        if config.USDC_MINT and len(config.USDC_MINT) < 32:
-            errors.append("USDC_MINT must be a valid Solana address")
-        
-        return errors, warnings
+        return _check_formats(_SOLANA_RULES, _ERROR)
     
-    def _validate_api_keys(self) -> tuple[List[str], List[str]]:
+    def _validate_api_keys(self) -> Iterator[Issue]:
         """Validate API key configuration"""
-        errors = []
-        warnings = []
-        
-        # Check API key format
-        if config.ONEINCH_API_KEY and len(config.ONEINCH_API_KEY) < 20:
-            warnings.append("ONEINCH_API_KEY seems too short - please verify it's correct")
-        
-        return errors, warnings
+        return _check_formats(_API_KEY_RULES, _WARNING)
     
-    def _validate_proxy_config(self) -> List[str]:
+    def _validate_proxy_config(self) -> Iterator[Issue]:
         """Validate proxy configuration"""
-        warnings = []
-        
         if config.ONEINCH_PROXY_URL and config.ONEINCH_CLOUD_PROXY_URL:
-            warnings.append(
+            yield _WARNING, (
                 "Both ONEINCH_PROXY_URL and ONEINCH_CLOUD_PROXY_URL are set. "
                 "Local proxy will take precedence."
             )
         
-        if config.ONEINCH_PROXY_URL:
-            if not config.ONEINCH_PROXY_URL.startswith("http"):
-                warnings.append("ONEINCH_PROXY_URL should be a valid HTTP/HTTPS URL")
-        
-        if config.ONEINCH_CLOUD_PROXY_URL:
-            if not config.ONEINCH_CLOUD_PROXY_URL.startswith("http"):
-                warnings.append("ONEINCH_CLOUD_PROXY_URL should be a valid HTTP/HTTPS URL")
-        
-        return warnings
+        yield from _check_formats(_PROXY_RULES, _WARNING)
     
     def get_recommended_config(self) -> Dict[str, Any]:
         """Get recommended configuration based on environment"""
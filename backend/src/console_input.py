@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+import codecs
+import os
+import sys
+import threading
+from typing import Optional
+
+
+class ConsoleReader:
+    """Queues console lines for async code without blocking the event loop.
+
+    On POSIX, stdin is watched with loop.add_reader, so no thread sits in a
+    read and the process exits as soon as the caller stops. Elsewhere a daemon
+    thread calls input(); console reads there do not hold the stdin buffer lock
+    that would stall interpreter shutdown.
+    """
+
+    def __init__(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._lines: "asyncio.Queue[Optional[str]]" = asyncio.Queue()
+        self._fd: Optional[int] = None
+        try:
+            fd = sys.stdin.fileno()
+            self._loop.add_reader(fd, self._on_readable)
+        except (NotImplementedError, OSError, ValueError):  # Windows loops, regular files
+            threading.Thread(target=self._produce, name="console-reader", daemon=True).start()
+            return
+        self._fd = fd
+        self._decoder = codecs.getincrementaldecoder(sys.stdin.encoding or "utf-8")(
+            errors=sys.stdin.errors or "strict"
+        )
+        self._partial = ""
+        # The callback only runs once the loop regains control, after this drain
+        self._drain_buffered(fd)
+
+    def _drain_buffered(self, fd: int) -> None:
+        # Earlier input() calls on a piped stdin may have buffered lines past the one
+        # they returned; hand those out first, since the fd will not report them again
+        if sys.stdin.isatty():
+            return
+        was_blocking = os.get_blocking(fd)
+        os.set_blocking(fd, False)
+        try:
+            while True:
+                line = sys.stdin.readline()  # "" once only the empty fd is left
+                if not line.endswith("\n"):
+                    self._partial = line
+                    return
+                self._lines.put_nowait(line[:-1].removesuffix("\r"))
+        finally:
+            os.set_blocking(fd, was_blocking)
+
+    def _on_readable(self) -> None:
+        data = os.read(self._fd, 65536)
+        if not data:  # EOF: like input(), return a trailing unterminated line first
+            self.close()
+            tail = self._partial + self._decoder.decode(b"", final=True)
+            if tail:
+                self._lines.put_nowait(tail)
+            self._lines.put_nowait(None)
+            return
+        *lines, self._partial = (self._partial + self._decoder.decode(data)).split("\n")
+        for line in lines:
+            self._lines.put_nowait(line.removesuffix("\r"))
+
+    def _produce(self) -> None:
+        while True:
+            try:
+                line: Optional[str] = input()
+            except EOFError:
+                line = None
+            try:
+                self._loop.call_soon_threadsafe(self._lines.put_nowait, line)
+            except RuntimeError:  # event loop already closed
+                return
+            if line is None:
+                return
+
+    def close(self) -> None:
+        """Stop watching stdin; lines still queued are discarded."""
+        if self._fd is not None:
+            self._loop.remove_reader(self._fd)
+            self._fd = None
+
+    async def readline(self, prompt: str = "") -> Optional[str]:
+        """Show the prompt and wait for the next line; None once stdin is closed."""
+        print(prompt, end="", flush=True)
+        return await self._lines.get()
@@ -2,12 +2,20 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Type
 
+import orjson
+import requests
+from eth_abi import encode
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
-from web3 import Web3
+from eth_utils import function_signature_to_4byte_selector
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from web3 import HTTPProvider, Web3
 from web3.contract import Contract
+from web3.types import RPCEndpoint, RPCResponse
 
 from . import config
 
@@ -40,41 +48,93 @@ ERC20_ABI = [
 ]
 
 
-UNISWAP_V3_ROUTER_ABI = [
+MULTICALL3_ABI = [
     {
         "inputs": [
             {
                 "components": [
-                    {"internalType": "address", "name": "tokenIn", "type": "address"},
-                    {"internalType": "address", "name": "tokenOut", "type": "address"},
-                    {"internalType": "uint24", "name": "fee", "type": "uint24"},
-                    {"internalType": "address", "name": "recipient", "type": "address"},
-                    {"internalType": "uint256", "name": "deadline", "type": "uint256"},
-                    {"internalType": "uint256", "name": "amountIn", "type": "uint256"},
-                    {
-                        "internalType": "uint256",
-                        "name": "amountOutMinimum",
-                        "type": "uint256",
-                    },
-                    {
-                        "internalType": "uint160",
-                        "name": "sqrtPriceLimitX96",
-                        "type": "uint160",
-                    },
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"},
                 ],
-                "internalType": "struct ISwapRouter.ExactInputSingleParams",
-                "name": "params",
-                "type": "tuple",
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]",
             }
         ],
-        "name": "exactInputSingle",
-        "outputs": [{"internalType": "uint256", "name": "amountOut", "type": "uint256"}],
         "stateMutability": "payable",
         "type": "function",
     }
 ]
 
 
+# Calldata for the two write paths is encoded by hand: the selectors and
+# argument layouts never change, so there is no need to go through the
+# contract ABI machinery on every swap.
+# ISwapRouter.ExactInputSingleParams: (tokenIn, tokenOut, fee, recipient, deadline,
+# amountIn, amountOutMinimum, sqrtPriceLimitX96)
+_EXACT_INPUT_SINGLE_TUPLE = "(address,address,uint24,address,uint256,uint256,uint256,uint160)"
+_EXACT_INPUT_SINGLE_SELECTOR: bytes = function_signature_to_4byte_selector(
+    f"exactInputSingle({_EXACT_INPUT_SINGLE_TUPLE})"
+)
+_APPROVE_SELECTOR: bytes = function_signature_to_4byte_selector("approve(address,uint256)")
+
+# Fixed EIP-1559 fee caps, in wei
+_MAX_FEE_PER_GAS = 2_000_000_000  # 2 gwei
+_MAX_PRIORITY_FEE_PER_GAS = 1_000_000_000  # 1 gwei
+
+
+@lru_cache(maxsize=256)
+def _checksum_lower(address_lower: str) -> str:
+    return Web3.to_checksum_address(address_lower)
+
+
+def _checksum(address: str) -> str:
+    """EIP-55 checksum an address, memoized since it hashes the hex each time."""
+    return _checksum_lower(address.lower())
+
+
+def _orjson_default(value: Any) -> Any:
+    # HexBytes and web3's AttributeDict show up in RPC params
+    if isinstance(value, bytes):
+        return "0x" + value.hex()
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class _OrjsonHTTPProvider(HTTPProvider):
+    """HTTPProvider that encodes and decodes JSON-RPC payloads with orjson."""
+
+    def encode_rpc_request(self, method: RPCEndpoint, params: Any) -> bytes:
+        rpc_dict = {
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params or [],
+            "id": next(self.request_counter),
+        }
+        try:
+            return orjson.dumps(rpc_dict, default=_orjson_default)
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits; web3's own encoder handles those
+            return super().encode_rpc_request(method, params)
+
+    def decode_rpc_response(self, raw_response: bytes) -> RPCResponse:
+        return orjson.loads(raw_response)
+
+
 @dataclass
 class SwapResult:
     tx_hash: str
@@ -86,9 +146,24 @@ class DEXClient:
     def __init__(self) -> None:
         if not config.RPC_URL:
             raise RuntimeError("RPC_URL is not configured")
-        self.web3 = Web3(Web3.HTTPProvider(config.RPC_URL, request_kwargs={"timeout": 60}))
+        # One pooled keep-alive session for every RPC call made by this client
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            # JSON-RPC is all POST, which urllib3 never replays after a response or read
+            # error, so this only retries failed connects; eth_sendRawTransaction is not resent
+            max_retries=Retry(total=3, backoff_factor=0.2),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers["Connection"] = "keep-alive"
+        self.web3 = Web3(
+            _OrjsonHTTPProvider(config.RPC_URL, request_kwargs={"timeout": 60}, session=self._session)
+        )
         if not self.web3.is_connected():
             raise RuntimeError("Failed to connect to RPC")
+        self._send_raw = self.web3.eth.send_raw_transaction
 
         if not config.PRIVATE_KEY:
             raise RuntimeError("PRIVATE_KEY missing")
@@ -98,44 +173,107 @@ class DEXClient:
             pass
         self.account = acct
 
+        # Settings used on every transaction, read once (chain presets are applied before clients are built)
+        self.chain_id = config.CHAIN_ID
+        self.router_address = config.UNISWAP_V3_ROUTER_ADDRESS
+        self._router_cs = _checksum(self.router_address) if self.router_address else None
+        self.multicall_address = config.MULTICALL3_ADDRESS
+
+        # ERC20 decimals never change, so look each token up once
+        self._decimals_cache: Dict[str, int] = {}
+        # ABIs are parsed once into contract factories; bound contract objects
+        # are then built once per lower-cased address
+        self._erc20_factory: Type[Contract] = self.web3.eth.contract(abi=ERC20_ABI)
+        self._multicall_factory: Type[Contract] = self.web3.eth.contract(abi=MULTICALL3_ABI)
+        self._contracts: Dict[str, Contract] = {}
+        for address in (config.WETH_ADDRESS, config.USDC_ADDRESS):
+            if address:
+                self._erc20(address)
+
+    def _contract(self, address: str, factory: Type[Contract]) -> Contract:
+        key = address.lower()
+        contract = self._contracts.get(key)
+        if contract is None:
+            contract = factory(address=_checksum(address))
+            self._contracts[key] = contract
+        return contract
+
     def _erc20(self, address: str) -> Contract:
-        return self.web3.eth.contract(address=self.web3.to_checksum_address(address), abi=ERC20_ABI)
+        return self._contract(address, self._erc20_factory)
 
-    def _router(self) -> Contract:
-        if not config.UNISWAP_V3_ROUTER_ADDRESS:
-            raise RuntimeError("UNISWAP_V3_ROUTER_ADDRESS is not configured")
-        return self.web3.eth.contract(
-            address=self.web3.to_checksum_address(config.UNISWAP_V3_ROUTER_ADDRESS),
-            abi=UNISWAP_V3_ROUTER_ABI,
-        )
+    def _multicall(self, calls: List[Tuple[str, bytes]]) -> List[bytes]:
+        """Run several read-only calls in one eth_call through Multicall3."""
+        multicall = self._contract(self.multicall_address, self._multicall_factory)
+        results = multicall.functions.aggregate3([(target, False, data) for target, data in calls]).call()
+        return [return_data for _success, return_data in results]
+
+    def get_balances(self, token_addresses: Iterable[str], owner: Optional[str] = None) -> Dict[str, float]:
+        owner_addr = _checksum(owner or self.account.address)
+        tokens = {address: self._erc20(address) for address in token_addresses}
+        if not tokens:
+            return {}
+
+        if not self.multicall_address:
+            balances = {}
+            for address, token in tokens.items():
+                key = token.address.lower()
+                if key not in self._decimals_cache:
+                    self._decimals_cache[key] = token.functions.decimals().call()
+                raw = token.functions.balanceOf(owner_addr).call()
+                balances[address] = raw / (10 ** self._decimals_cache[key])
+            return balances
+
+        # One balanceOf per token, plus decimals for tokens not seen before
+        calls: List[Tuple[str, bytes]] = []
+        missing_decimals: Dict[str, int] = {}
+        for token in tokens.values():
+            calls.append((token.address, token.encodeABI(fn_name="balanceOf", args=[owner_addr])))
+        for token in tokens.values():
+            key = token.address.lower()
+            if key not in self._decimals_cache and key not in missing_decimals:
+                missing_decimals[key] = len(calls)
+                calls.append((token.address, token.encodeABI(fn_name="decimals")))
+
+        results = self._multicall(calls)
+        for key, index in missing_decimals.items():
+            (self._decimals_cache[key],) = self.web3.codec.decode(["uint8"], results[index])
+
+        balances = {}
+        for index, (address, token) in enumerate(tokens.items()):
+            (raw,) = self.web3.codec.decode(["uint256"], results[index])
+            balances[address] = raw / (10 ** self._decimals_cache[token.address.lower()])
+        return balances
 
     def get_balance(self, token_address: str, owner: Optional[str] = None) -> float:
-        owner_addr = owner or self.account.address
-        token = self._erc20(token_address)
-        decimals = token.functions.decimals().call()
-        raw = token.functions.balanceOf(self.web3.to_checksum_address(owner_addr)).call()
-        return raw / (10 ** decimals)
+        return self.get_balances([token_address], owner)[token_address]
+
+    def _tx_fields(self, nonce: Optional[int] = None) -> Dict[str, Any]:
+        """Transaction fields we always set ourselves, so web3 never has to
+        fetch chainId/fee defaults over RPC."""
+        if nonce is None:
+            nonce = self.web3.eth.get_transaction_count(self.account.address)
+        return {
+            "chainId": self.chain_id,
+            "nonce": nonce,
+            "maxFeePerGas": _MAX_FEE_PER_GAS,
+            "maxPriorityFeePerGas": _MAX_PRIORITY_FEE_PER_GAS,
+            "from": self.account.address,
+        }
 
     def _build_and_send(self, tx: Dict[str, Any]) -> str:
-        nonce = self.web3.eth.get_transaction_count(self.account.address)
-        tx.update(
-            {
-                "chainId": config.CHAIN_ID,
-                "nonce": nonce,
-                "maxFeePerGas": self.web3.to_wei("2", "gwei"),
-                "maxPriorityFeePerGas": self.web3.to_wei("1", "gwei"),
-                "from": self.account.address,
-            }
-        )
         signed = self.account.sign_transaction(tx)
-        tx_hash = self.web3.eth.send_raw_transaction(signed.rawTransaction)
-        return tx_hash.hex()
+        # eth-account 0.13 renamed rawTransaction to raw_transaction
+        raw = getattr(signed, "raw_transaction", None) or signed.rawTransaction
+        return self._send_raw(raw).hex()
 
-    def approve(self, token_address: str, spender: str, amount_wei: int) -> str:
-        token = self._erc20(token_address)
-        tx = token.functions.approve(self.web3.to_checksum_address(spender), amount_wei).build_transaction(
-            {"gas": 120000}
-        )
+    def approve(self, token_address: str, spender: str, amount_wei: int, nonce: Optional[int] = None) -> str:
+        tx = {
+            **self._tx_fields(nonce),
+            "to": _checksum(token_address),
+            "data": _APPROVE_SELECTOR + encode(["address", "uint256"], [_checksum(spender), amount_wei]),
+            "gas": 120000,
+            "value": 0,
+        }
         return self._build_and_send(tx)
 
     def execute_swap(
@@ -146,13 +284,14 @@ class DEXClient:
         fee: int = 3000,
         slippage_bps: int = 50,
     ) -> SwapResult:
-        router = self._router()
+        if not self._router_cs:
+            raise RuntimeError("UNISWAP_V3_ROUTER_ADDRESS is not configured")
         deadline = int(time.time()) + 600
         amount_out_min = int(amount_in_wei * (1 - slippage_bps / 10000))
 
         params = (
-            self.web3.to_checksum_address(token_in),
-            self.web3.to_checksum_address(token_out),
+            _checksum(token_in),
+            _checksum(token_out),
             fee,
             self.account.address,
             deadline,
@@ -161,10 +300,19 @@ class DEXClient:
             0,
         )
 
+        # Fetch the nonce once and pipeline approve (n) and swap (n + 1) back to back
+        nonce = self.web3.eth.get_transaction_count(self.account.address)
+
         # Approval
-        approve_tx = self.approve(token_in, config.UNISWAP_V3_ROUTER_ADDRESS, amount_in_wei)
+        approve_tx = self.approve(token_in, self._router_cs, amount_in_wei, nonce=nonce)
 
-        tx = router.functions.exactInputSingle(params).build_transaction({"gas": 500000, "value": 0})
+        tx = {
+            **self._tx_fields(nonce + 1),
+            "to": self._router_cs,
+            "data": _EXACT_INPUT_SINGLE_SELECTOR + encode([_EXACT_INPUT_SINGLE_TUPLE], [params]),
+            "gas": 500000,
+            "value": 0,
+        }
         tx_hash = self._build_and_send(tx)
         return SwapResult(tx_hash=tx_hash, amount_out=None)
 
@@ -1,18 +1,37 @@
 from __future__ import annotations
 
+import json
+import logging
 import os
 import time
-from typing import Any, Dict, Optional, Tuple
+from decimal import Context, Decimal, localcontext
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Union
 
-import requests
+import aiohttp
+from coincurve import PrivateKey as _SecpPrivateKey
+from Crypto.Hash import keccak as _crypto_keccak
 from eth_account import Account
-from eth_keys import keys
-from eth_utils import keccak, to_bytes, to_canonical_address
+from eth_utils import to_bytes, to_canonical_address
 from web3 import Web3
 
 from . import config
 
 
+# Order amounts and prices; pass str or Decimal to avoid binary float rounding
+Amount = Union[float, str, Decimal]
+
+# Wide enough for amount * price * 10**18 without rounding
+_AMOUNT_CTX = Context(prec=50)
+
+
+def _to_decimal(value: Amount) -> Decimal:
+    if isinstance(value, Decimal):
+        return value
+    # str() of a float is its shortest round-tripping form, so 0.1 becomes Decimal("0.1")
+    return Decimal(str(value))
+
+
 class LimitOrderClient:
     """1inch Limit Order Protocol client (EVM) using 1inch Orderbook API v4.0 and manual EIP-712 signing."""
 
@@ -31,6 +50,29 @@ class LimitOrderClient:
         self.account = Account.from_key(config.PRIVATE_KEY)
         self.addr = self.account.address
         self.chain_id = int(config.CHAIN_ID)
+        # Signed with libsecp256k1 through coincurve rather than eth_keys' backend dispatch
+        self._signing_key = _SecpPrivateKey(bytes.fromhex(config.PRIVATE_KEY.removeprefix("0x")))
+
+        # Read once here rather than hitting os.environ on every order
+        self.verifying_contract = os.getenv("ONEINCH_LOP_ADDRESS") or (config.ONEINCH_LOP_ADDRESS or "")
+
+        # The EIP-712 domain and our own address are the same for every order we sign
+        self._domain_sep: Optional[bytes] = None
+        if self.verifying_contract:
+            self._domain_sep = _domain_separator(
+                {
+                    "name": _DOMAIN_NAME,
+                    "version": _DOMAIN_VERSION,
+                    "chainId": self.chain_id,
+                    "verifyingContract": self.verifying_contract,
+                }
+            )
+        # Order struct encoding buffer: the type hash and our maker/receiver words are
+        # written once, each order only overwrites the variable words in place
+        self._order_buf = bytearray(9 * 32)
+        self._order_buf[0:32] = _ORDER_TYPEHASH
+        self._order_buf[64:96] = _enc_addr(self.addr)
+        self._order_buf[96:128] = _enc_addr(self.addr)
 
         # CORRECTED: Using the v4.0 API endpoint.
         self.base_url = f"https://api.1inch.dev/orderbook/v4.0/{self.chain_id}"
@@ -42,46 +84,95 @@ class LimitOrderClient:
             "content-type": "application/json",
         }
 
-    def _token_meta(self, symbol: str) -> Tuple[str, int]:
+        # Supported tokens as symbol -> (address, decimals, 10**decimals); WETH/USDC only when configured
+        self._token_table: Dict[str, Tuple[str, int, int]] = {
+            "ETH": ("0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE", 18, 10**18),
+        }
+        for symbol, address, decimals in (("WETH", config.WETH_ADDRESS, 18), ("USDC", config.USDC_ADDRESS, 6)):
+            if address and address.lower() not in ("0x", "0x0"):
+                self._token_table[symbol] = (address, decimals, 10**decimals)
+
+        self.logger = logging.getLogger(__name__)
+
+        # Shared keep-alive HTTP session, created on first use inside the running event loop
+        self._http: Optional[aiohttp.ClientSession] = None
+
+    def _get_http(self) -> aiohttp.ClientSession:
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+
+    def _token_meta(self, symbol: str) -> Tuple[str, int, int]:
+        """Return (address, decimals, 10**decimals) for a supported symbol."""
         s = symbol.upper()
-        if s == "ETH":
-            return ("0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE", 18)
-        if s == "WETH":
-            if not config.WETH_ADDRESS or config.WETH_ADDRESS.lower() in ("0x", "0x0"):
-                raise RuntimeError("WETH_ADDRESS not configured")
-            return (config.WETH_ADDRESS, 18)
-        if s == "USDC":
-            if not config.USDC_ADDRESS or config.USDC_ADDRESS.lower() in ("0x", "0x0"):
-                raise RuntimeError("USDC_ADDRESS not configured")
-            return (config.USDC_ADDRESS, 6)
-        raise RuntimeError(f"Unknown token symbol: {symbol}")
-
-    def _amounts(self, side: str, base_dec: int, quote_dec: int, base_amt: float, limit_px: float) -> Tuple[int, int]:
-        if side.upper() == "BUY":
-            # For a BUY order, you are GIVING quote currency and GETTING base currency.
-            # makingAmount is the amount you give (quote), takingAmount is the amount you get (base).
-            making_amount = int(base_amt * limit_px * (10**quote_dec))
-            taking_amount = int(base_amt * (10**base_dec))
-        else: # SELL
-            # For a SELL order, you are GIVING base currency and GETTING quote currency.
-            making_amount = int(base_amt * (10**base_dec))
-            taking_amount = int(base_amt * limit_px * (10**quote_dec))
+        meta = self._token_table.get(s)
+        if meta is None:
+            if s in ("WETH", "USDC"):
+                raise RuntimeError(f"{s}_ADDRESS not configured")
+            raise RuntimeError(f"Unknown token symbol: {symbol}")
+        return meta
+
+    def _amounts(
+        self, side: str, base_scale: int, quote_scale: int, base_amt: Amount, limit_px: Amount
+    ) -> Tuple[int, int]:
+        # Decimal arithmetic keeps 18-decimal amounts exact instead of rounding through a float
+        base_amt = _to_decimal(base_amt)
+        limit_px = _to_decimal(limit_px)
+        with localcontext(_AMOUNT_CTX):
+            if side.upper() == "BUY":
+                # For a BUY order, you are GIVING quote currency and GETTING base currency.
+                # makingAmount is the amount you give (quote), takingAmount is the amount you get (base).
+                making_amount = int(base_amt * limit_px * quote_scale)
+                taking_amount = int(base_amt * base_scale)
+            else: # SELL
+                # For a SELL order, you are GIVING base currency and GETTING quote currency.
+                making_amount = int(base_amt * base_scale)
+                taking_amount = int(base_amt * limit_px * quote_scale)
         return making_amount, taking_amount
 
-    def create_and_submit(
+    def _hash_order(
+        self,
+        salt: int,
+        maker_asset: str,
+        taker_asset: str,
+        making_amount: int,
+        taking_amount: int,
+        maker_traits: int,
+    ) -> bytes:
+        # Order(salt, maker, receiver, makerAsset, takerAsset, makingAmount, takingAmount, makerTraits);
+        # maker and receiver are always us and already sit in the buffer. Address words
+        # keep their 12 leading zero bytes since only the last 20 bytes are ever written.
+        # Not thread-safe; orders are only signed from the event loop.
+        buf = self._order_buf
+        buf[32:64] = salt.to_bytes(32, "big")
+        buf[140:160] = _canonical_address(maker_asset)
+        buf[172:192] = _canonical_address(taker_asset)
+        buf[192:224] = making_amount.to_bytes(32, "big")
+        buf[224:256] = taking_amount.to_bytes(32, "big")
+        buf[256:288] = maker_traits.to_bytes(32, "big")
+        return _keccak256(buf)
+
+    async def create_and_submit(
         self,
         *,
         side: str,
         base: str,
         quote: str,
-        amount: float,
-        limit_price: float,
+        amount: Amount,
+        limit_price: Amount,
         expiry_secs: int,
         partial_fill: bool,
         post_only: bool,
     ) -> Dict[str, Any]:
-        base_token_addr, base_dec = self._token_meta(base)
-        quote_token_addr, quote_dec = self._token_meta(quote)
+        base_token_addr, _, base_scale = self._token_meta(base)
+        quote_token_addr, _, quote_scale = self._token_meta(quote)
 
         # CORRECTED: Logic to correctly assign maker/taker assets based on trade side.
         # This was the root cause of the "Invalid address 0x" error.
@@ -94,13 +185,12 @@ class LimitOrderClient:
             maker_asset = base_token_addr
             taker_asset = quote_token_addr
 
-        making_amount, taking_amount = self._amounts(side, base_dec, quote_dec, amount, limit_price)
+        making_amount, taking_amount = self._amounts(side, base_scale, quote_scale, amount, limit_price)
 
         salt = str(int(time.time() * 1000))
         deadline = int(time.time()) + int(expiry_secs)
 
-        verifying_contract = os.getenv("ONEINCH_LOP_ADDRESS") or (config.ONEINCH_LOP_ADDRESS or "")
-        if not verifying_contract:
+        if self._domain_sep is None:
             raise RuntimeError("ONEINCH_LOP_ADDRESS is not configured")
 
         # --- v4.0 `makerTraits` calculation ---
@@ -117,50 +207,16 @@ class LimitOrderClient:
         traits |= (deadline << 208)
         # For a basic order, we don't need other flags like `allowedSender` (which is now part of traits).
 
-        # CORRECTED: The entire EIP-712 structure is updated for LOP v4.0.
-        typed_data = {
-            "types": {
-                "EIP712Domain": [
-                    {"name": "name", "type": "string"},
-                    {"name": "version", "type": "string"},
-                    {"name": "chainId", "type": "uint256"},
-                    {"name": "verifyingContract", "type": "address"},
-                ],
-                "Order": [
-                    {"name": "salt", "type": "uint256"},
-                    {"name": "maker", "type": "address"},
-                    {"name": "receiver", "type": "address"},
-                    {"name": "makerAsset", "type": "address"},
-                    {"name": "takerAsset", "type": "address"},
-                    {"name": "makingAmount", "type": "uint256"},
-                    {"name": "takingAmount", "type": "uint256"},
-                    {"name": "makerTraits", "type": "uint256"},
-                ],
-            },
-            "domain": {
-                "name": "1inch Limit Order Protocol",
-                "version": "4", # <-- CORRECTED to v4
-                "chainId": self.chain_id,
-                "verifyingContract": verifying_contract,
-            },
-            "primaryType": "Order",
-            "message": {
-                "salt": int(salt),
-                "maker": self.addr,
-                "receiver": self.addr,
-                "makerAsset": maker_asset,
-                "takerAsset": taker_asset,
-                "makingAmount": int(making_amount),
-                "takingAmount": int(taking_amount),
-                "makerTraits": traits,
-            },
-        }
-
-        digest = _eip712_digest(typed_data)
-        pk_bytes = bytes.fromhex(config.PRIVATE_KEY.removeprefix("0x"))
-        signature = keys.PrivateKey(pk_bytes).sign_msg_hash(digest).to_hex()
+        # Hash the v4 Order struct and sign its EIP-712 digest under the cached domain separator
+        order_hash_bytes = self._hash_order(
+            int(salt), maker_asset, taker_asset, int(making_amount), int(taking_amount), traits
+        )
+        digest = _keccak256(b"\x19\x01" + self._domain_sep + order_hash_bytes)
+        # r || s || recovery id, with v moved to the 27/28 form ecrecover expects
+        sig = self._signing_key.sign_recoverable(digest, hasher=None)
+        signature = "0x" + sig[:64].hex() + format(sig[64] + 27, "02x")
 
-        order_hash = "0x" + _hash_order(typed_data["message"]).hex()
+        order_hash = "0x" + order_hash_bytes.hex()
 
         # CORRECTED: The final payload must match the signed message structure exactly.
         payload = {
@@ -181,15 +237,6 @@ class LimitOrderClient:
             },
         }
 
-        # Optional debug: Uncomment to see the exact payload being sent.
-        # import json
-        # print("Submitting to 1inch Orderbook:", json.dumps(payload, indent=2))
-                # Optional debug: Uncomment to see the exact payload being sent.
-        # import json
-        # print("Submitting to 1inch Orderbook:", json.dumps(payload, indent=2))
-
-        # DEBUG: print equivalent curl
-        import json as _json
         target_url = self.base_url
         headers = dict(self.headers)
 
@@ -200,87 +247,79 @@ class LimitOrderClient:
             headers.pop("Authorization", None)
             headers.pop("X-API-KEY", None)
 
-        _curl = (
-            "curl -X POST "
-            + f"'{target_url}' "
-            + "-H 'accept: application/json' "
-            + "-H 'content-type: application/json' "
-            + ("" if "Authorization" not in headers else f"-H 'Authorization: {headers['Authorization']}' ")
-            + f"--data '{_json.dumps(payload, separators=(',', ':'))}'"
-        )
-        print("cURL ->", _curl)
-
-        r = requests.post(target_url, json=payload, headers=headers, timeout=30)
-        # r = requests.post(self.base_url, json=payload, headers=self.headers, timeout=30)
-        if not r.ok:
-            try:
-                print("1inch response:", r.status_code, r.text)
-            except Exception:
-                pass
-        r.raise_for_status()
-        return r.json()
+        # Equivalent cURL for reproducing submissions; only serialized when DEBUG logging is on
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("cURL -> %s", _build_curl(target_url, headers, payload))
+
+        async with self._get_http().post(target_url, json=payload, headers=headers) as r:
+            if not r.ok:
+                try:
+                    print("1inch response:", r.status, await r.text())
+                except Exception:
+                    pass
+            r.raise_for_status()
+            return await r.json(content_type=None)
+
+
+def _build_curl(url: str, headers: Dict[str, str], payload: Dict[str, Any]) -> str:
+    return (
+        "curl -X POST "
+        + f"'{url}' "
+        + "-H 'accept: application/json' "
+        + "-H 'content-type: application/json' "
+        + ("" if "Authorization" not in headers else f"-H 'Authorization: {headers['Authorization']}' ")
+        + f"--data '{json.dumps(payload, separators=(',', ':'))}'"
+    )
 
 
 # ---- EIP-712 helpers updated for v4.0 Order struct ----
 
-def _type_hash_order() -> bytes:
-    # CORRECTED: Hashing the new v4 Order struct string.
-    t = (
-        "Order("
-        "uint256 salt,"
-        "address maker,"
-        "address receiver,"
-        "address makerAsset,"
-        "address takerAsset,"
-        "uint256 makingAmount,"
-        "uint256 takingAmount,"
-        "uint256 makerTraits"
-        ")"
-    )
-    return keccak(text=t)
+def _keccak256(data: bytes) -> bytes:
+    # Call pycryptodome's C Keccak directly, skipping eth_hash's per-call backend dispatch
+    return _crypto_keccak.new(digest_bits=256, data=data).digest()
+
+_DOMAIN_NAME = "1inch Limit Order Protocol"
+_DOMAIN_VERSION = "4"
+
+# Type hashes are constant, so hash them once at import
+_ORDER_TYPEHASH = _keccak256(
+    b"Order("
+    b"uint256 salt,"
+    b"address maker,"
+    b"address receiver,"
+    b"address makerAsset,"
+    b"address takerAsset,"
+    b"uint256 makingAmount,"
+    b"uint256 takingAmount,"
+    b"uint256 makerTraits"
+    b")"
+)
+_DOMAIN_TYPEHASH = _keccak256(b"EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)")
 
 def _hash_bytes(b: bytes | str) -> bytes:
     if isinstance(b, (bytes, bytearray)):
         data = bytes(b)
     else:
         data = to_bytes(hexstr=b)
-    return keccak(data)
+    return _keccak256(data)
+
+@lru_cache(maxsize=512)
+def _canonical_address(v: str) -> bytes:
+    # Token and maker addresses recur across orders; parse/validate each string once
+    return to_canonical_address(v)
 
 def _enc_addr(v: str) -> bytes:
-    return b"\x00" * 12 + to_canonical_address(v)
+    return b"\x00" * 12 + _canonical_address(v)
 
 def _enc_uint(v: int) -> bytes:
     return int(v).to_bytes(32, "big")
 
-def _hash_order(msg: dict) -> bytes:
-    # CORRECTED: Hashing the fields of the new v4 Order struct.
-    parts = [
-        _type_hash_order(),
-        _enc_uint(msg["salt"]),
-        _enc_addr(msg["maker"]),
-        _enc_addr(msg["receiver"]),
-        _enc_addr(msg["makerAsset"]),
-        _enc_addr(msg["takerAsset"]),
-        _enc_uint(msg["makingAmount"]),
-        _enc_uint(msg["takingAmount"]),
-        _enc_uint(msg["makerTraits"]),
-    ]
-    return keccak(b"".join(parts))
-
 def _domain_separator(domain: dict) -> bytes:
-    t = "EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)"
-    type_hash = keccak(text=t)
     parts = [
-        type_hash,
-        keccak(text=domain["name"]),
-        keccak(text=domain["version"]),
+        _DOMAIN_TYPEHASH,
+        _keccak256(domain["name"].encode()),
+        _keccak256(domain["version"].encode()),
         _enc_uint(domain["chainId"]),
         _enc_addr(domain["verifyingContract"]),
     ]
-    return keccak(b"".join(parts))
-
-def _eip712_digest(typed: dict) -> bytes:
-    ds = _domain_separator(typed["domain"])
-    oh = _hash_order(typed["message"])
-    return keccak(b"\x19\x01" + ds + oh)
-
+    return _keccak256(b"".join(parts))
@@ -1,43 +1,52 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import itertools
 import os
 import time
-from datetime import datetime, timezone
 
 from . import config
-from .dex_client import DEXClient
-from .oneinch_client import OneInchClient
-from .pyth_client import PythPriceClient
-from .trading_strategy import SMACrossoverStrategy, TradingSignal
-from .zerog_client import ZeroGClient
+from .console_input import ConsoleReader
 from .nlp_parser import parse_intent
-from .advanced_hooks import build_twap, build_ladder, build_dutch, ChildOrder
-from .limit_order_client import LimitOrderClient
-from .order_store import OrderStore
-from .order_monitor import OrderMonitor
-from .real_time_trader import RealTimeTrader
+from .strategy_factory import make_strategy_config
+
+
+_strategy_ids = itertools.count(1)
+
+
+# Settings a preset may override, with the type config stores each one as
+_CONFIG_KEYS: tuple[tuple[str, type], ...] = (
+    ("RPC_URL", str),
+    ("CHAIN_ID", int),
+    ("ONEINCH_CHAIN_ID", int),
+    ("WETH_ADDRESS", str),
+    ("USDC_ADDRESS", str),
+    ("PYTH_ETH_USD_FEED_ID", str),
+    ("SOLANA_RPC_URL", str),
+    ("SOLANA_PUBLIC_KEY", str),
+    ("WSOL_MINT", str),
+    ("USDC_MINT", str),
+    ("PYTH_ETH_USD_FEED_ID_SOL", str),
+    ("TRADE_AMOUNT_LAMPORTS", int),
+)
 
 
 def _apply_chain_overrides(preset: dict[str, str | int]) -> None:
-    for k, v in preset.items():
-        os.environ[str(k)] = str(v)
-    config.RPC_URL = str(preset.get("RPC_URL", config.RPC_URL))
-    config.CHAIN_ID = int(preset.get("CHAIN_ID", config.CHAIN_ID or 0)) or config.CHAIN_ID
-    config.ONEINCH_CHAIN_ID = int(preset.get("ONEINCH_CHAIN_ID", config.ONEINCH_CHAIN_ID or 0)) or config.ONEINCH_CHAIN_ID
-    config.WETH_ADDRESS = str(preset.get("WETH_ADDRESS", config.WETH_ADDRESS or "")) or config.WETH_ADDRESS
-    config.USDC_ADDRESS = str(preset.get("USDC_ADDRESS", config.USDC_ADDRESS or "")) or config.USDC_ADDRESS
-    config.PYTH_ETH_USD_FEED_ID = str(preset.get("PYTH_ETH_USD_FEED_ID", config.PYTH_ETH_USD_FEED_ID or "")) or config.PYTH_ETH_USD_FEED_ID
-    config.SOLANA_RPC_URL = str(preset.get("SOLANA_RPC_URL", config.SOLANA_RPC_URL or "")) or config.SOLANA_RPC_URL
-    config.SOLANA_PUBLIC_KEY = str(preset.get("SOLANA_PUBLIC_KEY", config.SOLANA_PUBLIC_KEY or "")) or config.SOLANA_PUBLIC_KEY
-    config.WSOL_MINT = str(preset.get("WSOL_MINT", config.WSOL_MINT or "")) or config.WSOL_MINT
-    config.USDC_MINT = str(preset.get("USDC_MINT", config.USDC_MINT or "")) or config.USDC_MINT
-    config.PYTH_ETH_USD_FEED_ID_SOL = str(preset.get("PYTH_ETH_USD_FEED_ID_SOL", config.PYTH_ETH_USD_FEED_ID_SOL or "")) or config.PYTH_ETH_USD_FEED_ID_SOL
-    config.TRADE_AMOUNT_LAMPORTS = int(preset.get("TRADE_AMOUNT_LAMPORTS", config.TRADE_AMOUNT_LAMPORTS or 0)) or config.TRADE_AMOUNT_LAMPORTS
+    os.environ.update({str(k): str(v) for k, v in preset.items()})
+    for key, typ in _CONFIG_KEYS:
+        if key not in preset:
+            continue
+        value = typ(preset[key])
+        # Empty or zero preset values keep whatever config already has
+        if value and value != getattr(config, key):
+            setattr(config, key, value)
 
 
-def select_chain_interactively() -> str:
-    presets: list[tuple[str, dict[str, str | int]]] = [
+@functools.cache
+def _presets() -> tuple[tuple[str, dict[str, str | int]], ...]:
+    """Mode presets, built once from the startup environment. Treat as read-only."""
+    return (
         (
             "Real-time Arbitrum Trading (1inch)",
             {
@@ -71,7 +80,11 @@ def select_chain_interactively() -> str:
                 "PYTH_ETH_USD_FEED_ID": config.PYTH_ETH_USD_FEED_ID or "0xff61491a931112ddf1bd8147cd1b641375f79f5825126d665480874634fd0ace",
             },
         ),
-    ]
+    )
+
+
+def select_chain_interactively() -> str:
+    presets = _presets()
 
     print("Choose trading mode:")
     for idx, (name, _) in enumerate(presets, start=1):
@@ -94,16 +107,22 @@ async def run_background_llm_strategies():
     print("🧠 Background LLM Strategies Mode")
     print("Enter your trading plan. The bot will execute it in background for the specified duration.")
     
+    # Imported here so the mode menu shows before the web3/solana client stack loads
+    from .real_time_trader import RealTimeTrader
+
     # Initialize the trader once
     trader = RealTimeTrader(is_solana=False)
     trader_task = None
+    console = ConsoleReader()
     
     while True:
-        text = input("\n> Enter strategy (or 'quit' to exit): ").strip()
+        line = await console.readline("\n> Enter strategy (or 'quit' to exit): ")
+        text = "quit" if line is None else line.strip()  # closed stdin ends the session
         if text.lower() in ('quit', 'exit', 'q'):
             if trader_task:
                 trader.running = False
                 trader_task.cancel()
+            console.close()
             break
             
         parsed = parse_intent(text)
@@ -112,47 +131,17 @@ async def run_background_llm_strategies():
             continue
 
         # Create strategy configuration
-        strategy_id = f"llm_{int(time.time())}"
-        duration_secs = parsed.get("duration_secs", 3600)  # Default 1 hour
-        expires_at = time.time() + duration_secs
-        
-        strategy_config = {
-            "mode": parsed["mode"],
-            "side": parsed["side"],
-            "expires_at": expires_at,
-            "parsed_intent": parsed,
-            "original_text": text,
-            "created_at": time.time(),
-        }
-        
-        # Add strategy-specific configuration
-        if parsed["mode"] == "twap":
-            children = build_twap(
-                parsed["side"], 
-                parsed.get("base", "ETH"), 
-                parsed.get("quote", "USDC"),
-                float(parsed["total_amount"]), 
-                float(parsed["start_price"]), 
-                parsed.get("end_price"), 
-                int(parsed["duration_secs"]), 
-                int(parsed["slices"]), 
-                int(parsed["expiry_each_secs"]), 
-                bool(parsed.get("post_only", False)), 
-                strategy_id
-            )
-            strategy_config.update({
-                "children": [c.__dict__ for c in children],
-                "total_slices": len(children),
-                "slice_interval": duration_secs // len(children),
-                "slice_index": 0,
-                "last_slice_time": 0,
-            })
+        now = time.time()
+        # The counter keeps ids unique when two strategies arrive within the same second
+        strategy_id = f"llm_{int(now)}_{next(_strategy_ids)}"
+        duration_secs = parsed.duration_secs or 3600  # Default 1 hour
+        strategy_config = make_strategy_config(parsed, strategy_id, text, now)
         
         # Add strategy to trader
         trader.add_strategy(strategy_id, strategy_config)
         
         print(f"✅ Strategy '{strategy_id}' added and will run for {duration_secs/3600:.1f} hours")
-        print(f"📊 Strategy details: {parsed['mode'].upper()} - {parsed['side']} - Duration: {duration_secs}s")
+        print(f"📊 Strategy details: {parsed.mode.upper()} - {parsed.side} - Duration: {duration_secs}s")
         
         # Start trader if not already running
         if trader_task is None or trader_task.done():
@@ -168,6 +157,8 @@ async def run_real_time_trading(is_solana: bool = False):
     mode_name = "Solana" if is_solana else "Arbitrum"
     print(f"⚡ Real-time {mode_name} trading started (1-second price updates)")
     
+    from .real_time_trader import RealTimeTrader
+
     trader = RealTimeTrader(is_solana=is_solana)
     
     # Add a simple momentum strategy
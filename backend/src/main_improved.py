@@ -4,25 +4,23 @@ Improved main entry point with better error handling and configuration validatio
 from __future__ import annotations
 
 import asyncio
+import itertools
 import os
 import sys
 import time
-from datetime import datetime, timezone
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from . import config
 from .config_validator import validate_and_setup_config
-from .dex_client import DEXClient
-from .oneinch_client import OneInchClient
-from .pyth_client import PythPriceClient
-from .trading_strategy import SMACrossoverStrategy, TradingSignal
-from .zerog_client import ZeroGClient
+from .console_input import ConsoleReader
 from .nlp_parser import parse_intent
-from .advanced_hooks import build_twap, build_ladder, build_dutch, ChildOrder
-from .limit_order_client import LimitOrderClient
-from .order_store import OrderStore
-from .order_monitor import OrderMonitor
-from .real_time_trader import RealTimeTrader
+from .strategy_factory import make_strategy_config
+
+if TYPE_CHECKING:
+    # The trader pulls in the whole web3/solana client stack; it is imported once a mode is picked
+    from .real_time_trader import RealTimeTrader
+
+
+_strategy_ids = itertools.count(1)
 
 
 class TradingBotApp:
@@ -88,6 +86,8 @@ class TradingBotApp:
         print(f"\n⚡ Starting real-time {chain_name} trading...")
         
         try:
+            from .real_time_trader import RealTimeTrader
+
             self.trader = RealTimeTrader(is_solana=is_solana)
             self.running = True
             
@@ -113,6 +113,8 @@ class TradingBotApp:
         print("Type 'help' for examples, 'status' for current state, or 'quit' to exit.")
         
         try:
+            from .real_time_trader import RealTimeTrader
+
             self.trader = RealTimeTrader(is_solana=False)
             self.running = True
             
@@ -137,9 +139,11 @@ class TradingBotApp:
     
     async def _interactive_command_loop(self):
         """Interactive command loop for background strategies"""
+        console = ConsoleReader()
         while self.running:
             try:
-                command = input("\n> ").strip()
+                line = await console.readline("\n> ")
+                command = "quit" if line is None else line.strip()  # closed stdin ends the session
                 
                 
                 if command.lower() in ('quit', 'exit', 'q'):
@@ -157,6 +161,7 @@ class TradingBotApp:
                 break
             except Exception as e:
                 print(f"❌ Error processing command: {e}")
+        console.close()
     
     def _show_help(self):
         """Show help information"""
@@ -204,47 +209,17 @@ class TradingBotApp:
                 return
             
             # Create strategy configuration
-            strategy_id = f"llm_{int(time.time())}"
-            duration_secs = parsed.get("duration_secs", 3600)
-            expires_at = time.time() + duration_secs
-            
-            strategy_config = {
-                "mode": parsed["mode"],
-                "side": parsed["side"],
-                "expires_at": expires_at,
-                "parsed_intent": parsed,
-                "original_text": command,
-                "created_at": time.time(),
-            }
-            
-            # Add strategy-specific configuration
-            if parsed["mode"] == "twap":
-                children = build_twap(
-                    parsed["side"], 
-                    parsed.get("base", "ETH"), 
-                    parsed.get("quote", "USDC"),
-                    float(parsed["total_amount"]), 
-                    float(parsed["start_price"]), 
-                    parsed.get("end_price"), 
-                    int(parsed["duration_secs"]), 
-                    int(parsed["slices"]), 
-                    int(parsed["expiry_each_secs"]), 
-                    bool(parsed.get("post_only", False)), 
-                    strategy_id
-                )
-                strategy_config.update({
-                    "children": [c.__dict__ for c in children],
-                    "total_slices": len(children),
-                    "slice_interval": duration_secs // len(children),
-                    "slice_index": 0,
-                    "last_slice_time": 0,
-                })
+            now = time.time()
+            # The counter keeps ids unique when two strategies arrive within the same second
+            strategy_id = f"llm_{int(now)}_{next(_strategy_ids)}"
+            duration_secs = parsed.duration_secs or 3600
+            strategy_config = make_strategy_config(parsed, strategy_id, command, now)
             
             # Add strategy to trader
             self.trader.add_strategy(strategy_id, strategy_config)
             
             print(f"✅ Strategy '{strategy_id}' added successfully!")
-            print(f"📊 Mode: {parsed['mode'].upper()} | Side: {parsed['side']} | Duration: {duration_secs/3600:.1f}h")
+            print(f"📊 Mode: {parsed.mode.upper()} | Side: {parsed.side} | Duration: {duration_secs/3600:.1f}h")
             
         except Exception as e:
             print(f"❌ Error processing strategy: {e}")
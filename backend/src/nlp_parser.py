@@ -1,13 +1,79 @@
 from __future__ import annotations
 
 import re
-from typing import Optional, TypedDict, Literal, Dict, Any
+from functools import lru_cache
+from typing import Callable, FrozenSet, NamedTuple, Optional, Literal, Dict, Any
+
+try:
+    import ahocorasick
+except ImportError:  # optional C extension; plain substring tests are used without it
+    ahocorasick = None
 
 
 Mode = Literal["simple", "twap", "ladder", "dutch", "bracket"]
 
+# Patterns are compiled once here; parse_intent runs on every command
+_DEC = r"\d+(?:\.\d+)?"
+_NUM = "(" + _DEC + ")"
+_RE_BASE_QUOTE = re.compile(r"(eth|weth|arb|usdc)\b")
+_RE_AMT = re.compile(r"(\d+(?:\.\d+)?)\s*(eth|weth|arb)")
+_RE_BAND = re.compile(_NUM + r"\s*-\s*" + _NUM)
+_RE_STEPS = re.compile(r"(\d+)\s*steps")
+_RE_ENTRY = re.compile(r"entry\s*" + _NUM)
+_RE_TAKE = re.compile(r"take(\s*profit)?\s*" + _NUM)
+_RE_STOP = re.compile(r"stop\s*" + _NUM)
+_RE_AT = re.compile(r"at\s*" + _NUM)
+_RE_AT2 = re.compile(r"@\s*" + _NUM)
+
+# All fields of a twap/dutch prompt in one alternation, read in a single finditer
+# pass by _first_fields. Each branch holds exactly one named group; prices sit in
+# lookaheads so their digits stay free for the amount branch, as with separate searches.
+_RE_TWAP_FIELDS = re.compile(
+    rf"(?P<amt>{_DEC})\s*(?:eth|weth|arb)"
+    rf"|from\s*(?=(?P<start>{_DEC}))"
+    rf"|to\s*(?=(?P<end>{_DEC}))"
+    r"|(?P<slices>\d+)\s*slices"
+)
+_RE_DUTCH_FIELDS = re.compile(
+    rf"(?P<amt>{_DEC})\s*(?:eth|weth|arb)"
+    rf"|start\s*(?=(?P<start>{_DEC}))"
+    rf"|end\s*(?=(?P<end>{_DEC}))"
+    rf"|step\s*(?=(?P<step>{_DEC}))"
+)
+
+# Every keyword the parser tests for by substring. One Aho-Corasick pass over the
+# text finds all of them (overlaps included), instead of one scan per keyword.
+_KEYWORDS = (
+    "week", "7d", "day", "24h", "today", "1d", "12h", "2h", "1h", "60m", "30m", "5m",
+    "arbitrum", "ethereum", "mainnet",
+    "buy", "sell",
+    "post only", "maker only", "fill-or-kill", "no partial",
+    "steps", "every", "take", "stop",
+)
+
+
+def _build_automaton():
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in _KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_AUTOMATON = _build_automaton()
+
 
-class ParsedBase(TypedDict, total=False):
+def _keyword_hits(t: str) -> FrozenSet[str]:
+    """Return the keywords occurring anywhere in already lowercased text."""
+    if _AUTOMATON is None:
+        return frozenset(keyword for keyword in _KEYWORDS if keyword in t)
+    return frozenset(keyword for _end, keyword in _AUTOMATON.iter(t))
+
+
+class ParsedIntent(NamedTuple):
+    """One parsed command; fields a mode does not use stay None."""
     mode: Mode
     side: Literal["BUY", "SELL"]
     base: str
@@ -15,86 +81,76 @@ class ParsedBase(TypedDict, total=False):
     chain: str
     post_only: bool
     partial_fill: bool
-
-
-class ParsedSimple(ParsedBase, total=False):
-    amount: float
-    limit_price: float
-    expiry_secs: int
-
-
-class ParsedTWAP(ParsedBase, total=False):
-    total_amount: float
-    start_price: float
-    end_price: float | None
-    duration_secs: int
-    slices: int
-    expiry_each_secs: int
-
-
-class ParsedLadder(ParsedBase, total=False):
-    total_amount: float
-    p_min: float
-    p_max: float
-    steps: int
-    expiry_secs: int
-
-
-class ParsedDutch(ParsedBase, total=False):
-    amount: float
-    start_price: float
-    end_price: float
-    step: float
-    step_secs: int
-    expiry_each_secs: int
-
-
-class ParsedBracket(ParsedBase, total=False):
-    amount: float
-    entry: float
-    take_profit: float
-    stop: float
-    expiry_secs: int
-
-
-def _parse_time_secs(text: str) -> int:
-    t = text.lower()
-    if "week" in t or "7d" in t:
-        return 7 * 24 * 3600
-    if "day" in t or "24h" in t or "today" in t or "1d" in t:
-        return 24 * 3600
-    if "12h" in t:
-        return 12 * 3600
-    if "2h" in t:
-        return 2 * 3600
-    if "1h" in t or "60m" in t:
-        return 3600
-    if "30m" in t:
-        return 1800
-    if "5m" in t:
-        return 300
-    return 24 * 3600
-
-
-def _chain(text: str) -> str:
-    t = text.lower()
-    if "arbitrum" in t:
+    # simple, dutch, bracket
+    amount: Optional[float] = None
+    # twap, ladder
+    total_amount: Optional[float] = None
+    # simple
+    limit_price: Optional[float] = None
+    # twap, dutch
+    start_price: Optional[float] = None
+    end_price: Optional[float] = None
+    expiry_each_secs: Optional[int] = None
+    # twap
+    duration_secs: Optional[int] = None
+    slices: Optional[int] = None
+    # ladder
+    p_min: Optional[float] = None
+    p_max: Optional[float] = None
+    steps: Optional[int] = None
+    # dutch
+    step: Optional[float] = None
+    step_secs: Optional[int] = None
+    # bracket
+    entry: Optional[float] = None
+    take_profit: Optional[float] = None
+    stop: Optional[float] = None
+    # simple, ladder, bracket
+    expiry_secs: Optional[int] = None
+
+
+# Checked in order: the first duration keyword present wins
+_TIME_KEYWORDS: tuple[tuple[str, int], ...] = (
+    ("week", 7 * 24 * 3600), ("7d", 7 * 24 * 3600),
+    ("day", 24 * 3600), ("24h", 24 * 3600), ("today", 24 * 3600), ("1d", 24 * 3600),
+    ("12h", 12 * 3600),
+    ("2h", 2 * 3600),
+    ("1h", 3600), ("60m", 3600),
+    ("30m", 1800),
+    ("5m", 300),
+)
+
+
+def _time_secs(hits: FrozenSet[str]) -> int:
+    return next((secs for keyword, secs in _TIME_KEYWORDS if keyword in hits), 24 * 3600)
+
+
+def _chain(hits: FrozenSet[str]) -> str:
+    if "arbitrum" in hits:
         return "arbitrum"
-    if "ethereum" in t or "mainnet" in t:
+    if "ethereum" in hits or "mainnet" in hits:
         return "ethereum"
     return "arbitrum"
 
 
-def _side(text: str) -> Optional[str]:
-    if "buy" in text:
+def _first_fields(pattern: re.Pattern[str], t: str) -> Dict[str, str]:
+    """Map each named group of an alternation pattern to its first match in t."""
+    fields: Dict[str, str] = {}
+    for m in pattern.finditer(t):
+        fields.setdefault(m.lastgroup, m.group(m.lastgroup))
+    return fields
+
+
+def _side(hits: FrozenSet[str]) -> Optional[str]:
+    if "buy" in hits:
         return "BUY"
-    if "sell" in text:
+    if "sell" in hits:
         return "SELL"
     return None
 
 
 def _base_quote(text: str) -> tuple[Optional[str], Optional[str]]:
-    m = re.search(r"(eth|weth|arb|usdc)\b", text)
+    m = _RE_BASE_QUOTE.search(text)
     base = None
     if m:
         tok = m.group(1).upper()
@@ -111,133 +167,187 @@ def _base_quote(text: str) -> tuple[Optional[str], Optional[str]]:
     return None, None
 
 
-def parse_intent(text: str) -> Optional[Dict[str, Any]]:
-    t = text.strip().lower()
+# Dropped during normalisation: "$" before prices and sentence punctuation.
+# "." "-" "@" carry meaning for the patterns and stay, and so do commas.
+_NORM_TABLE = str.maketrans("", "", "$;!?'\"`")
+# Only a thousands separator is removed ("2,500"); a decimal comma ("1,5") is
+# left alone rather than turned into a larger number
+_RE_THOUSANDS_SEP = re.compile(r"(?<=\d),(?=\d{3}\b)")
+
+# Paraphrases of a mode word, rewritten so they dispatch (and cache) like it.
+# Token and chain names are deliberately not folded here.
+_SYNONYMS = {
+    "time-weighted": "twap",
+    "dca": "twap",
+}
+_RE_SYNONYM = re.compile(r"\b(?:" + "|".join(map(re.escape, _SYNONYMS)) + r")\b")
+
+
+def _normalize(text: str) -> str:
+    """Lowercase, drop punctuation, collapse whitespace and map mode synonyms."""
+    t = " ".join(text.lower().translate(_NORM_TABLE).split())
+    t = _RE_THOUSANDS_SEP.sub("", t)
+    return _RE_SYNONYM.sub(lambda m: _SYNONYMS[m.group()], t)
+
+
+def parse_intent(text: str) -> Optional[ParsedIntent]:
+    t = _normalize(text)
     if not t:
         return None
+    # Keyed on the normalised text, so paraphrases of one command share an entry
+    return _parse_normalized(t)
 
-    chain = _chain(t)
-    side = _side(t)
-    base, quote = _base_quote(t)
-    post_only = ("post only" in t) or ("maker only" in t)
-    partial_fill = ("fill-or-kill" not in t) and ("no partial" not in t)
-
-    if t.startswith("twap"):
-        m_amt = re.search(r"(\d+(?:\.\d+)?)\s*(eth|weth|arb)", t)
-        m_from = re.search(r"from\s*(\$?\d+(?:\.\d+)?)", t)
-        m_to = re.search(r"to\s*(\$?\d+(?:\.\d+)?)", t)
-        m_slices = re.search(r"(\d+)\s*slices", t)
-        dur = _parse_time_secs(t)
-        if not (side and m_amt and m_from):
-            return None
-        total_amount = float(m_amt.group(1))
-        start_price = float(m_from.group(1).replace("$", ""))
-        end_price = float(m_to.group(1).replace("$", "")) if m_to else None
-        slices = int(m_slices.group(1)) if m_slices else 6
-        return {
-            "mode": "twap",
-            "side": side,
-            "base": (base or "ETH"),
-            "quote": (quote or "USDC"),
-            "chain": chain,
-            "post_only": post_only,
-            "partial_fill": partial_fill,
-            "total_amount": total_amount,
-            "start_price": start_price,
-            "end_price": end_price,
-            "duration_secs": dur,
-            "slices": slices,
-            "expiry_each_secs": max(300, dur // max(1, slices)),
-        }
-
-    if t.startswith("ladder") or "steps" in t:
-        m_amt = re.search(r"(\d+(?:\.\d+)?)\s*(eth|weth|arb)", t)
-        m_band = re.search(r"(\$?\d+(?:\.\d+)?)\s*-\s*(\$?\d+(?:\.\d+)?)", t)
-        m_steps = re.search(r"(\d+)\s*steps", t)
-        if not (side and m_amt and m_band):
-            return None
-        total_amount = float(m_amt.group(1))
-        p_min = float(m_band.group(1).replace("$", ""))
-        p_max = float(m_band.group(2).replace("$", ""))
-        steps = int(m_steps.group(1)) if m_steps else 5
-        return {
-            "mode": "ladder",
-            "side": side,
-            "base": (base or "ETH"),
-            "quote": (quote or "USDC"),
-            "chain": chain,
-            "post_only": post_only,
-            "partial_fill": partial_fill,
-            "total_amount": total_amount,
-            "p_min": min(p_min, p_max),
-            "p_max": max(p_min, p_max),
-            "steps": steps,
-            "expiry_secs": _parse_time_secs(t),
-        }
-
-    if t.startswith("dutch") or "every" in t:
-        m_amt = re.search(r"(\d+(?:\.\d+)?)\s*(eth|weth|arb)", t)
-        m_start = re.search(r"start\s*(\$?\d+(?:\.\d+)?)", t)
-        m_end = re.search(r"end\s*(\$?\d+(?:\.\d+)?)", t)
-        m_step = re.search(r"step\s*(\$?\d+(?:\.\d+)?)", t)
-        step_secs = _parse_time_secs("5m" if "5m" in t else t)
-        if not (side and m_amt and m_start and m_end and m_step):
-            return None
-        return {
-            "mode": "dutch",
-            "side": side,
-            "base": (base or "ETH"),
-            "quote": (quote or "USDC"),
-            "chain": chain,
-            "post_only": post_only,
-            "partial_fill": partial_fill,
-            "amount": float(m_amt.group(1)),
-            "start_price": float(m_start.group(1).replace("$", "")),
-            "end_price": float(m_end.group(1).replace("$", "")),
-            "step": float(m_step.group(1).replace("$", "")),
-            "step_secs": step_secs,
-            "expiry_each_secs": max(300, step_secs),
-        }
-
-    if t.startswith("bracket") or "take" in t or "stop" in t:
-        m_amt = re.search(r"(\d+(?:\.\d+)?)\s*(eth|weth|arb)", t)
-        m_entry = re.search(r"entry\s*(\$?\d+(?:\.\d+)?)", t) or re.search(r"at\s*(\$?\d+(?:\.\d+)?)", t)
-        m_take = re.search(r"take(\s*profit)?\s*(\$?\d+(?:\.\d+)?)", t)
-        m_stop = re.search(r"stop\s*(\$?\d+(?:\.\d+)?)", t)
-        if not (side and m_amt and m_entry and m_take and m_stop):
-            return None
-        return {
-            "mode": "bracket",
-            "side": side,
-            "base": (base or "ETH"),
-            "quote": (quote or "USDC"),
-            "chain": chain,
-            "post_only": post_only,
-            "partial_fill": partial_fill,
-            "amount": float(m_amt.group(1)),
-            "entry": float(m_entry.group(1).replace("$", "")),
-            "take_profit": float(m_take.group(2).replace("$", "")),
-            "stop": float(m_stop.group(1).replace("$", "")),
-            "expiry_secs": _parse_time_secs(t),
-        }
-
-    m_amt = re.search(r"(\d+(?:\.\d+)?)\s*(eth|weth|arb)", t)
-    m_px = re.search(r"at\s*(\$?\d+(?:\.\d+)?)", t) or re.search(r"@\s*(\$?\d+(?:\.\d+)?)", t)
-    if side and m_amt and m_px:
-        return {
-            "mode": "simple",
-            "side": side,
-            "base": (base or "ETH"),
-            "quote": (quote or "USDC"),
-            "chain": chain,
-            "post_only": post_only,
-            "partial_fill": partial_fill,
-            "amount": float(m_amt.group(1)),
-            "limit_price": float(m_px.group(1).replace("$", "")),
-            "expiry_secs": _parse_time_secs(t),
-        }
 
-    return None
+@lru_cache(maxsize=512)
+def _parse_normalized(t: str) -> Optional[ParsedIntent]:
+    """Parse _normalize()d text; cached since prompts repeat.
+
+    ParsedIntent is immutable, so the cached object is handed out as is.
+    """
+    return _parse(t)
+
 
+# Every mode parser takes the same arguments so _parse can dispatch through one table:
+#   t       normalised prompt text
+#   hits    keywords found in t, for mode-specific flags (dutch reads "5m")
+#   common  the side/base/quote/chain/post_only/partial_fill fields shared by all modes
+#   dur     duration resolved once from hits
+# and returns None when a required field is missing.
+_ModeParser = Callable[[str, FrozenSet[str], Dict[str, Any], int], Optional[ParsedIntent]]
 
 
+def _parse_twap(
+    t: str, hits: FrozenSet[str], common: Dict[str, Any], dur: int
+) -> Optional[ParsedIntent]:
+    f = _first_fields(_RE_TWAP_FIELDS, t)
+    if not ("amt" in f and "start" in f):
+        return None
+    slices = int(f["slices"]) if "slices" in f else 6
+    return ParsedIntent(
+        mode="twap",
+        **common,
+        total_amount=float(f["amt"]),
+        start_price=float(f["start"]),
+        end_price=float(f["end"]) if "end" in f else None,
+        duration_secs=dur,
+        slices=slices,
+        expiry_each_secs=max(300, dur // max(1, slices)),
+    )
+
+
+def _parse_ladder(
+    t: str, hits: FrozenSet[str], common: Dict[str, Any], dur: int
+) -> Optional[ParsedIntent]:
+    m_amt = _RE_AMT.search(t)
+    m_band = _RE_BAND.search(t)
+    if not (m_amt and m_band):
+        return None
+    m_steps = _RE_STEPS.search(t)
+    p_min = float(m_band.group(1))
+    p_max = float(m_band.group(2))
+    return ParsedIntent(
+        mode="ladder",
+        **common,
+        total_amount=float(m_amt.group(1)),
+        p_min=min(p_min, p_max),
+        p_max=max(p_min, p_max),
+        steps=int(m_steps.group(1)) if m_steps else 5,
+        expiry_secs=dur,
+    )
+
+
+def _parse_dutch(
+    t: str, hits: FrozenSet[str], common: Dict[str, Any], dur: int
+) -> Optional[ParsedIntent]:
+    f = _first_fields(_RE_DUTCH_FIELDS, t)
+    if len(f) < 4:  # amt, start, end and step are all required
+        return None
+    step_secs = 300 if "5m" in hits else dur
+    return ParsedIntent(
+        mode="dutch",
+        **common,
+        amount=float(f["amt"]),
+        start_price=float(f["start"]),
+        end_price=float(f["end"]),
+        step=float(f["step"]),
+        step_secs=step_secs,
+        expiry_each_secs=max(300, step_secs),
+    )
+
+
+def _parse_bracket(
+    t: str, hits: FrozenSet[str], common: Dict[str, Any], dur: int
+) -> Optional[ParsedIntent]:
+    m_amt = _RE_AMT.search(t)
+    m_entry = _RE_ENTRY.search(t) or _RE_AT.search(t)
+    m_take = _RE_TAKE.search(t)
+    m_stop = _RE_STOP.search(t)
+    if not (m_amt and m_entry and m_take and m_stop):
+        return None
+    return ParsedIntent(
+        mode="bracket",
+        **common,
+        amount=float(m_amt.group(1)),
+        entry=float(m_entry.group(1)),
+        take_profit=float(m_take.group(2)),
+        stop=float(m_stop.group(1)),
+        expiry_secs=dur,
+    )
+
+
+def _parse_simple(
+    t: str, hits: FrozenSet[str], common: Dict[str, Any], dur: int
+) -> Optional[ParsedIntent]:
+    m_amt = _RE_AMT.search(t)
+    m_px = _RE_AT.search(t) or _RE_AT2.search(t)
+    if not (m_amt and m_px):
+        return None
+    return ParsedIntent(
+        mode="simple",
+        **common,
+        amount=float(m_amt.group(1)),
+        limit_price=float(m_px.group(1)),
+        expiry_secs=dur,
+    )
+
+
+_RE_MODE_PREFIX = re.compile(r"twap|ladder|dutch|bracket")
+
+_MODE_DISPATCH: Dict[str, _ModeParser] = {
+    "twap": _parse_twap,
+    "ladder": _parse_ladder,
+    "dutch": _parse_dutch,
+    "bracket": _parse_bracket,
+}
+
+
+def _parse(t: str) -> Optional[ParsedIntent]:
+    hits = _keyword_hits(t)
+    side = _side(hits)
+    if side is None:  # every mode needs a side
+        return None
+
+    m_mode = _RE_MODE_PREFIX.match(t)
+    if m_mode:
+        parse_mode = _MODE_DISPATCH[m_mode.group()]
+    # No explicit mode word: infer it from keywords, in the same order as before
+    elif "steps" in hits:
+        parse_mode = _parse_ladder
+    elif "every" in hits:
+        parse_mode = _parse_dutch
+    elif "take" in hits or "stop" in hits:
+        parse_mode = _parse_bracket
+    else:
+        parse_mode = _parse_simple
+
+    base, quote = _base_quote(t)
+    common = {
+        "side": side,
+        "base": (base or "ETH"),
+        "quote": (quote or "USDC"),
+        "chain": _chain(hits),
+        "post_only": ("post only" in hits) or ("maker only" in hits),
+        "partial_fill": ("fill-or-kill" not in hits) and ("no partial" not in hits),
+    }
+    # Resolved once here rather than inside each mode parser
+    return parse_mode(t, hits, common, _time_secs(hits))
@@ -5,6 +5,8 @@ import math
 from typing import Any, Dict, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from web3 import Web3
 from eth_account.signers.local import LocalAccount
 from eth_account import Account
@@ -27,6 +29,28 @@ class OneInchClient:
         
         self.api_key = config.ONEINCH_API_KEY
         self.is_solana = is_solana
+
+        # Built once; _resolve picks one per call since the proxy setting can change at runtime
+        self._api_headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "X-API-KEY": self.api_key,
+            "accept": "application/json",
+        }
+        # Authorization headers are left off when going through a proxy
+        self._proxy_headers = {"accept": "application/json"}
+
+        # One pooled keep-alive session so quote -> approve -> swap reuse a TLS connection
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            # raise_on_status=False hands back the final response, so raise_for_status still reports it
+            max_retries=Retry(
+                total=3, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504], raise_on_status=False
+            ),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)  # local proxies are often plain http
         
         if is_solana:
             # Solana configuration
@@ -68,37 +92,26 @@ class OneInchClient:
                 raise RuntimeError("PRIVATE_KEY missing")
             self.account: LocalAccount = Account.from_key(config.PRIVATE_KEY)
 
-    def _headers(self) -> Dict[str, str]:
-        return {
-            "Authorization": f"Bearer {self.api_key}",
-            "X-API-KEY": self.api_key,
-            "accept": "application/json",
-        }
-
     def _resolve(self, path: str) -> tuple[str, Dict[str, str]]:
         url = self.base_url + path
-        headers = self._headers()
         
         # Check for proxy configuration
         proxy = config.ONEINCH_PROXY_URL or config.ONEINCH_CLOUD_PROXY_URL
         if proxy:
-            # Remove authorization headers when using proxy
-            headers.pop("Authorization", None)
-            headers.pop("X-API-KEY", None)
             # Use proxy URL format
-            url = f"{str(proxy).rstrip('/')}/?url={url}"
+            return f"{str(proxy).rstrip('/')}/?url={url}", self._proxy_headers
             
-        return url, headers
+        return url, self._api_headers
 
     def _get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
         url, headers = self._resolve(path)
-        resp = requests.get(url, headers=headers, params=params, timeout=30)
+        resp = self._session.get(url, headers=headers, params=params, timeout=(5, 30))
         resp.raise_for_status()
         return resp.json()
 
     def _post(self, path: str, json_body: Dict[str, Any]) -> Dict[str, Any]:
         url, headers = self._resolve(path)
-        resp = requests.post(url, headers=headers, json=json_body, timeout=30)
+        resp = self._session.post(url, headers=headers, json=json_body, timeout=(5, 30))
         resp.raise_for_status()
         return resp.json()
 
@@ -18,6 +18,8 @@ class PythPriceClient:
 
     def __init__(self, base_url: Optional[str] = None) -> None:
         self.base_url = base_url or (config.PYTH_HTTP_ENDPOINT or "https://hermes.pyth.network")
+        # The price monitor polls every second; keep the Hermes connection alive between polls
+        self.session = requests.Session()
 
     async def get_latest_price(self, feed_id: Optional[str]) -> Optional[float]:
         if not feed_id:
@@ -29,7 +31,7 @@ class PythPriceClient:
         try:
             url = f"{self.base_url.rstrip('/')}/v2/updates/price/latest"
             # Pyth Hermes accepts either hex (0x...) or base58 ids
-            r = requests.get(url, params={"ids[]": feed_id}, timeout=15)
+            r = self.session.get(url, params={"ids[]": feed_id}, timeout=15)
             r.raise_for_status()
             data = r.json()
             # The response format contains an array of parsed price updates under
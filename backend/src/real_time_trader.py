@@ -2,8 +2,9 @@
 
 import asyncio
 import time
+from collections import deque
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from typing import Deque, Dict, Optional, Any
 
 from .pyth_client import PythPriceClient
 from .oneinch_client import OneInchClient
@@ -30,9 +31,12 @@ class RealTimeTrader:
         # Background tasks
         self.active_strategies: Dict[str, Dict[str, Any]] = {}
         self.running = False
+        # Set when a strategy is added so the executor picks it up without waiting a full cycle
+        self._wake = asyncio.Event()
         
         # Price tracking
-        self.price_history: List[float] = []
+        # Keep only last 100 prices; the deque evicts the oldest in O(1)
+        self.price_history: Deque[float] = deque(maxlen=100)
         self.last_price: Optional[float] = None
         
         # Add status logger
@@ -60,6 +64,9 @@ class RealTimeTrader:
             self.running = False
             for task in tasks:
                 task.cancel()
+        finally:
+            if self.limit_client:
+                await self.limit_client.aclose()
     
     async def _price_monitor(self):
         """Monitor prices in real-time"""
@@ -71,9 +78,6 @@ class RealTimeTrader:
                 if price is not None:
                     self.last_price = price
                     self.price_history.append(price)
-                    # Keep only last 100 prices
-                    if len(self.price_history) > 100:
-                        self.price_history.pop(0)
                     
                     print(f" Price: ${price:.2f}")
                     
@@ -92,21 +96,33 @@ class RealTimeTrader:
     
     async def _strategy_executor(self):
         """Execute background strategies"""
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
         while self.running:
+            # One wall-clock snapshot per cycle, shared by every strategy
+            now = time.time()
             try:
                 for strategy_id, strategy in list(self.active_strategies.items()):
-                    if strategy.get("expires_at") and time.time() > strategy["expires_at"]:
+                    if strategy.get("expires_at") and now > strategy["expires_at"]:
                         print(f" Strategy {strategy_id} expired")
                         del self.active_strategies[strategy_id]
                         continue
                     
                     # Execute strategy logic
-                    await self._execute_strategy(strategy_id, strategy)
+                    await self._execute_strategy(strategy_id, strategy, now)
                     
             except Exception as e:
                 print(f" Strategy execution error: {e}")
             
-            await asyncio.sleep(5)  # Check every 5 seconds
+            # Check every 5 seconds on the loop's monotonic clock so slow cycles don't drift,
+            # or sooner when add_strategy() signals new work
+            next_tick = max(next_tick + 5, loop.time())
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=next_tick - loop.time())
+                self._wake.clear()
+                next_tick = loop.time()
+            except asyncio.TimeoutError:
+                pass
     
     async def _order_monitor(self):
         """Monitor order status"""
@@ -185,24 +201,24 @@ class RealTimeTrader:
         except Exception as e:
             print(f" Triggered strategy execution failed: {e}")
     
-    async def _execute_strategy(self, strategy_id: str, strategy: Dict[str, Any]):
+    async def _execute_strategy(self, strategy_id: str, strategy: Dict[str, Any], now: float):
         """Execute background strategy logic"""
         mode = strategy.get("mode")
         
         if mode == "twap" and not self.is_solana:
-            await self._execute_twap_strategy(strategy_id, strategy)
+            await self._execute_twap_strategy(strategy_id, strategy, now)
         elif mode == "ladder" and not self.is_solana:
-            await self._execute_ladder_strategy(strategy_id, strategy)
+            await self._execute_ladder_strategy(strategy_id, strategy, now)
         elif mode == "dutch" and not self.is_solana:
-            await self._execute_dutch_strategy(strategy_id, strategy)
+            await self._execute_dutch_strategy(strategy_id, strategy, now)
     
-    async def _execute_twap_strategy(self, strategy_id: str, strategy: Dict[str, Any]):
+    async def _execute_twap_strategy(self, strategy_id: str, strategy: Dict[str, Any], now: float):
         """Execute TWAP strategy in background"""
         # Check if it's time for next slice
         last_slice_time = strategy.get("last_slice_time", 0)
         slice_interval = strategy.get("slice_interval", 300)
         
-        if time.time() - last_slice_time >= slice_interval:
+        if now - last_slice_time >= slice_interval:
             # Execute next slice
             slice_index = strategy.get("slice_index", 0)
             total_slices = strategy.get("total_slices", 1)
@@ -215,7 +231,7 @@ class RealTimeTrader:
                         child = children[slice_index]
                         
                         # Submit order
-                        result = self.limit_client.create_and_submit(
+                        result = await self.limit_client.create_and_submit(
                             side=child.side,
                             base=child.base,
                             quote=child.quote,
@@ -232,18 +248,18 @@ class RealTimeTrader:
                             print(f" TWAP slice {slice_index + 1}/{total_slices} submitted: {order_hash}")
                         
                         # Update strategy state
-                        strategy["last_slice_time"] = time.time()
+                        strategy["last_slice_time"] = now
                         strategy["slice_index"] = slice_index + 1
                         
                 except Exception as e:
                     print(f" TWAP slice execution failed: {e}")
     
-    async def _execute_ladder_strategy(self, strategy_id: str, strategy: Dict[str, Any]):
+    async def _execute_ladder_strategy(self, strategy_id: str, strategy: Dict[str, Any], now: float):
         """Execute ladder strategy in background"""
         # Similar to TWAP but with price-based triggers
         pass
     
-    async def _execute_dutch_strategy(self, strategy_id: str, strategy: Dict[str, Any]):
+    async def _execute_dutch_strategy(self, strategy_id: str, strategy: Dict[str, Any], now: float):
         """Execute Dutch auction strategy in background"""
         # Similar to TWAP but with decreasing prices
         pass
@@ -252,6 +268,7 @@ class RealTimeTrader:
         """Add a new background strategy"""
         self.active_strategies[strategy_id] = strategy_config
         print(f" Strategy {strategy_id} added: {strategy_config.get('mode', 'unknown')}")
+        self._wake.set()
         
         # Update status file immediately when strategy is added
         self.status_logger.update_status(self)
@@ -273,6 +290,6 @@ class RealTimeTrader:
         """Get current price information"""
         return {
             "current_price": self.last_price,
-            "price_history": self.price_history[-10:],  # Last 10 prices
+            "price_history": list(self.price_history)[-10:],  # Last 10 prices
             "active_strategies": len(self.active_strategies)
         }
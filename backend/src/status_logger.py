@@ -14,7 +14,7 @@ class StatusLogger:
             status = {
                 "running": trader_instance.running,
                 "current_price": trader_instance.last_price,
-                "price_history": trader_instance.price_history[-10:],
+                "price_history": list(trader_instance.price_history)[-10:],
                 "active_strategies": [
                     {
                         "id": strategy_id,
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from .advanced_hooks import ChildOrder, build_twap
+from .nlp_parser import ParsedIntent
+
+
+@lru_cache(maxsize=256)
+def _twap_children(
+    side: str,
+    base: str,
+    quote: str,
+    total_amount: float,
+    start_price: float,
+    end_price: Optional[float],
+    duration_secs: int,
+    slices: int,
+    expiry_each_secs: int,
+    post_only: bool,
+) -> Tuple[ChildOrder, ...]:
+    # Built untagged (tags are ":twap:<i>") so repeated intents share one set of slices
+    return tuple(
+        build_twap(
+            side, base, quote, total_amount, start_price, end_price,
+            duration_secs, slices, expiry_each_secs, post_only, "",
+        )
+    )
+
+
+def make_strategy_config(parsed: ParsedIntent, strategy_id: str, original_text: str, now: float) -> Dict[str, Any]:
+    """Turn a parsed intent into the strategy config RealTimeTrader runs."""
+    duration_secs = parsed.duration_secs or 3600  # Default 1 hour
+    strategy_config: Dict[str, Any] = {
+        "mode": parsed.mode,
+        "side": parsed.side,
+        "expires_at": now + duration_secs,
+        "parsed_intent": parsed,
+        "original_text": original_text,
+        "created_at": now,
+    }
+
+    # Add strategy-specific configuration
+    if parsed.mode == "twap":
+        # Kept as ChildOrder tuples: the TWAP executor reads child.side etc. directly
+        children = tuple(
+            c._replace(tag=strategy_id + c.tag)
+            for c in _twap_children(
+                parsed.side,
+                parsed.base,
+                parsed.quote,
+                parsed.total_amount,
+                parsed.start_price,
+                parsed.end_price,
+                parsed.duration_secs,
+                parsed.slices,
+                parsed.expiry_each_secs,
+                parsed.post_only,
+            )
+        )
+        strategy_config.update({
+            "children": children,
+            "total_slices": len(children),
+            "slice_interval": duration_secs // len(children),
+            "slice_index": 0,
+            "last_slice_time": 0,
+        })
+
+    return strategy_config
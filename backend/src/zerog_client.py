@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 from typing import Any, Dict, Optional
 
+import orjson
 import requests
 
 from . import config
@@ -14,13 +15,26 @@ class ZeroGClient:
         self.endpoint = endpoint or config.ZERO_G_RPC_URL
         if not self.endpoint:
             raise RuntimeError("ZERO_G_RPC_URL is not configured")
+        # Reuse one keep-alive connection pool across trade-log writes
+        self.session = requests.Session()
 
     def store_trade_log(self, data: Dict[str, Any]) -> str:
         payload = {"data": data}
-        resp = requests.post(self.endpoint, json=payload, timeout=30)
+        try:
+            body = orjson.dumps(payload)
+        except orjson.JSONEncodeError:
+            # e.g. wei amounts wider than 64 bits or NamedTuples; stdlib json handles those
+            body = json.dumps(payload).encode()
+        resp = self.session.post(
+            self.endpoint,
+            data=body,
+            headers={"Content-Type": "application/json"},
+            timeout=30,
+        )
         resp.raise_for_status()
-        body = resp.json()
-        return str(body.get("id") or body.get("tx_hash") or body)
+        # Stdlib decoding keeps large integer ids exact; orjson would turn them into floats
+        result = resp.json()
+        return str(result.get("id") or result.get("tx_hash") or result)
 
 
 
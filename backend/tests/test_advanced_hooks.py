@@ -0,0 +1,40 @@
+import pytest
+
+from src.advanced_hooks import build_dutch
+
+
+def _dutch_prices(side, start, end, step):
+    orders = build_dutch(side, "ETH", "USDC", 1.0, start, end, step, 60, 120, False, "t")
+    return [o.limit_price for o in orders]
+
+
+def test_dutch_step_dividing_span_keeps_end_price():
+    assert _dutch_prices("SELL", 2600, 2400, 50) == [2600, 2550, 2500, 2450, 2400]
+    assert _dutch_prices("BUY", 2400, 2600, 100) == [2400, 2500, 2600]
+
+
+def test_dutch_exact_end_survives_float_division():
+    # 0.3 / 0.1 is 2.9999999999999996; the tolerance still counts four levels
+    assert _dutch_prices("BUY", 1.0, 1.3, 0.1) == pytest.approx([1.0, 1.1, 1.2, 1.3])
+
+
+def test_dutch_step_not_dividing_span_stops_before_end():
+    assert _dutch_prices("SELL", 2600, 2400, 75) == [2600, 2525, 2450]
+
+
+def test_dutch_end_on_wrong_side_gives_no_levels():
+    assert _dutch_prices("SELL", 2400, 2600, 50) == []
+    # start == end is a single level
+    assert _dutch_prices("BUY", 2500, 2500, 50) == [2500]
+
+
+def test_dutch_child_tags_and_flags():
+    orders = build_dutch("SELL", "ETH", "USDC", 0.5, 2600, 2500, 50, 60, 120, True, "t")
+    assert [o.tag for o in orders] == ["t:dutch:0", "t:dutch:1", "t:dutch:2"]
+    assert all(o.partial_fill and o.post_only and o.expiry_secs == 120 for o in orders)
+
+
+@pytest.mark.parametrize("step", [0, -10])
+def test_dutch_rejects_non_positive_step(step):
+    with pytest.raises(ValueError):
+        build_dutch("SELL", "ETH", "USDC", 1.0, 2600, 2400, step, 60, 120, False, "t")
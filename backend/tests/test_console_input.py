@@ -0,0 +1,67 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parent.parent
+
+# Reads until None and prints each result, so the parent sees the exact sequence
+_READER_SCRIPT = """
+import asyncio
+from src.console_input import ConsoleReader
+
+async def main():
+    reader = ConsoleReader()
+    while True:
+        line = await reader.readline()
+        print(repr(line))
+        if line is None:
+            break
+
+asyncio.run(main())
+"""
+
+
+def _read_through_pipe(data: bytes) -> list:
+    env = dict(os.environ, PYTHONNODOTENV="1")
+    proc = subprocess.run(
+        [sys.executable, "-c", _READER_SCRIPT],
+        input=data,
+        capture_output=True,
+        cwd=BACKEND,
+        env=env,
+        timeout=10,
+    )
+    assert proc.returncode == 0, proc.stderr.decode()
+    return [eval(line) for line in proc.stdout.decode().splitlines()]
+
+
+def test_lines_come_back_in_order_then_none():
+    assert _read_through_pipe(b"buy 1 eth\n\nstatus\r\nlast") == ["buy 1 eth", "", "status", "last", None]
+
+
+def test_empty_pipe_gives_none():
+    assert _read_through_pipe(b"") == [None]
+
+
+def test_lines_written_after_start_arrive_through_the_watcher():
+    env = dict(os.environ, PYTHONNODOTENV="1")
+    proc = subprocess.Popen(
+        [sys.executable, "-u", "-c", _READER_SCRIPT],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        cwd=BACKEND,
+        env=env,
+    )
+    try:
+        seen = []
+        for line in (b"first\n", b"second\n"):
+            proc.stdin.write(line)
+            proc.stdin.flush()
+            seen.append(eval(proc.stdout.readline()))
+        proc.stdin.close()
+        seen.extend(eval(line) for line in proc.stdout.read().decode().splitlines())
+        assert proc.wait(timeout=10) == 0
+    finally:
+        proc.kill()
+    assert seen == ["first", "second", None]
@@ -0,0 +1,79 @@
+from src.nlp_parser import _normalize, parse_intent
+
+
+def test_thousands_separator_is_dropped():
+    parsed = parse_intent("BUY 2 ETH AT $2,500")
+    assert parsed is not None
+    assert parsed.mode == "simple"
+    assert parsed.limit_price == 2500.0
+
+
+def test_thousands_separator_with_decimals_and_millions():
+    assert _normalize("at 2,500.50") == "at 2500.50"
+    assert _normalize("at 1,500,000") == "at 1500000"
+
+
+def test_decimal_comma_is_not_inflated():
+    assert _normalize("sell 1,5 eth at 3000") == "sell 1,5 eth at 3000"
+    parsed = parse_intent("sell 1,5 eth at 3000")
+    assert parsed is None or parsed.amount != 15.0
+
+
+def test_sentence_punctuation_and_whitespace():
+    assert _normalize("  Buy 1 ETH at $2000,   post only!  ") == "buy 1 eth at 2000, post only"
+    assert parse_intent("buy 1 eth at 2000  post   only").post_only is True
+
+
+def test_mode_synonyms_parse_as_twap():
+    expected = parse_intent("twap buy 1 eth from 2000")
+    assert expected is not None and expected.mode == "twap"
+    assert parse_intent("dca buy 1 eth from 2000") == expected
+    assert parse_intent("Time-Weighted buy 1 eth from 2000") == expected
+
+
+def test_synonyms_only_replace_whole_words():
+    assert _normalize("dcax buy") == "dcax buy"
+
+
+def test_token_names_are_not_folded():
+    assert parse_intent("buy 1 weth at 2000").base == "ETH"
+    assert "weth" in _normalize("buy 1 WETH at 2000")
+
+
+def test_blank_input():
+    assert parse_intent("") is None
+    assert parse_intent("  $ ") is None
+
+
+def test_leading_mode_word_wins_over_keywords():
+    # "steps" would route to ladder, but the leading mode word decides
+    dutch = parse_intent("dutch sell 1 eth start 2600 end 2400 step 10 every 5m 3 steps")
+    assert dutch is not None
+    assert dutch.mode == "dutch"
+    assert dutch.step_secs == 300
+    # "every" would route to dutch
+    bracket = parse_intent("bracket buy 1 eth entry 2500 take 2700 stop 2400 every day")
+    assert bracket is not None
+    assert bracket.mode == "bracket"
+    assert (bracket.entry, bracket.take_profit, bracket.stop) == (2500.0, 2700.0, 2400.0)
+
+
+def test_mode_word_is_a_prefix_match():
+    assert parse_intent("twap: buy 1 eth from 2000 to 2100 in 4 slices").mode == "twap"
+
+
+def test_keyword_fallback_order():
+    # steps > every > take/stop > simple, as before the dispatch table
+    assert parse_intent("buy 1 eth 2400 - 2600 in 3 steps every 5m").mode == "ladder"
+    assert parse_intent("sell 1 eth start 2600 end 2400 step 10 every 12h take").mode == "dutch"
+    assert parse_intent("buy 0.5 eth at 2500 take 2700 stop 2300").mode == "bracket"
+    assert parse_intent("buy 1 eth at 2500").mode == "simple"
+
+
+def test_keyword_fallback_returns_none_when_fields_missing():
+    # Routed to dutch by "every", which then lacks start/end/step
+    assert parse_intent("buy 1 eth at 2500 every 5m") is None
+
+
+def test_no_side_returns_none():
+    assert parse_intent("twap 2 eth from 100") is None